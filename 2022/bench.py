@@ -0,0 +1,260 @@
+"""Benchmarks each part of every day and compares the timings against a baseline.
+
+With --sweep, the parts are instead timed on synthetic inputs of increasing size and
+a power law is fitted to the timings. The parse stage of each day gets its own fit,
+reported as part 0, since some days do most of their work there.
+"""
+
+import argparse
+import importlib
+import json
+import math
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+from generators import generate
+from runner import (
+    DIRECTORY,
+    PARTS,
+    discover_parts,
+    load_input,
+    module_name,
+    parse_stage,
+)
+
+OUTPUT_PATH = os.path.join(os.path.dirname(DIRECTORY), "bench_output.txt")
+BASELINE_PATH = os.path.join(DIRECTORY, "bench_baseline.json")
+MIN_DELTA = 0.001
+
+
+@dataclass
+class Benchmark:
+    day: int
+    part: int
+    runs: int
+    min: float
+    median: float
+    p95: float
+    peak_memory: int
+    parse: float = 0.0
+
+    @property
+    def key(self) -> str:
+        return f"{self.day}.{self.part}"
+
+    def __str__(self) -> str:
+        return (
+            f"Day {self.day:>2} part {self.part}: "
+            f"min={self.min:.4f}s median={self.median:.4f}s p95={self.p95:.4f}s "
+            f"peak={self.peak_memory / 2**20:.1f}MiB parse={self.parse:.4f}s"
+        )
+
+
+@dataclass
+class Scaling:
+    day: int
+    part: int
+    sizes: list[int]
+    medians: list[float]
+    exponent: float
+
+    def __str__(self) -> str:
+        stage = f"part {self.part}" if self.part else "parse"
+        return (
+            f"Day {self.day:>2} {stage}: time ~ n^{self.exponent:.2f} "
+            f"over n={self.sizes[0]}..{self.sizes[-1]}"
+        )
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * q
+    lower = int(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+
+def time_runs(
+    solve: Callable[[Any], Any], data: Any, warmup: int, repeat: int
+) -> list[float]:
+    for _ in range(warmup):
+        solve(data)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        solve(data)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def peak_memory(solve: Callable[[Any], Any], data: Any) -> int:
+    tracemalloc.start()
+    try:
+        solve(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def measure(
+    day: int,
+    part: int,
+    solve: Callable[[Any], Any],
+    data: Any,
+    warmup: int,
+    repeat: int,
+) -> Benchmark:
+    timings = time_runs(solve, data, warmup, repeat)
+    return Benchmark(
+        day=day,
+        part=part,
+        runs=repeat,
+        min=min(timings),
+        median=statistics.median(timings),
+        p95=percentile(timings, 0.95),
+        peak_memory=peak_memory(solve, data),
+    )
+
+
+def benchmark_part(day: int, part: int, warmup: int = 1, repeat: int = 5) -> Benchmark:
+    """Times the part on its parsed input, with the median parse time on the side."""
+    module = importlib.import_module(module_name(day))
+    data = load_input(day, module)
+    parse = parse_stage(module)
+    parse_median = statistics.median(time_runs(parse, data, 0, repeat))
+    solve = getattr(module, PARTS[part - 1])
+    result = measure(day, part, solve, parse(data), warmup, repeat)
+    result.parse = parse_median
+    return result
+
+
+def scaling_exponent(sizes: list[int], timings: list[float]) -> float:
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(t) for t in timings]
+    return statistics.linear_regression(xs, ys).slope
+
+
+def sweep_part(
+    day: int, part: int, sizes: list[int], seed: int, warmup: int, repeat: int
+) -> Scaling:
+    """Fits the scaling of a part on its parsed input, or of the parse if part is 0."""
+    module = importlib.import_module(module_name(day))
+    parse = parse_stage(module)
+    solve = getattr(module, PARTS[part - 1]) if part else parse
+    medians = []
+    for size in sizes:
+        data = generate(day, size, seed)
+        if part:
+            data = parse(data)
+        medians.append(statistics.median(time_runs(solve, data, warmup, repeat)))
+    return Scaling(day, part, sizes, medians, scaling_exponent(sizes, medians))
+
+
+def write_results(results: list[Benchmark] | list[Scaling], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump([asdict(r) for r in results], f, indent=2)
+
+
+def read_results(path: str) -> dict[str, Benchmark]:
+    with open(path) as f:
+        results = [Benchmark(**r) for r in json.load(f)]
+    return {r.key: r for r in results}
+
+
+def is_regression(
+    seconds: float, reference: float, threshold: float, min_delta: float = MIN_DELTA
+) -> bool:
+    """Whether seconds is over threshold slower than the reference.
+
+    Slowdowns under min_delta seconds are ignored, as they are timer noise on parts
+    running in well under a millisecond.
+    """
+    return seconds > reference * (1 + threshold) and seconds - reference > min_delta
+
+
+def regressions(
+    results: list[Benchmark],
+    baseline: dict[str, Benchmark],
+    threshold: float,
+    min_delta: float = MIN_DELTA,
+) -> list[str]:
+    """Flags medians over threshold slower than the baseline, see is_regression."""
+    messages = []
+    for r in results:
+        if r.key not in baseline:
+            continue
+        reference = baseline[r.key].median
+        if is_regression(r.median, reference, threshold, min_delta):
+            messages.append(
+                f"Day {r.day:>2} part {r.part}: median {r.median:.4f}s is "
+                f"{r.median / reference - 1:.0%} slower than baseline {reference:.4f}s"
+            )
+    return messages
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default all)")
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default=OUTPUT_PATH)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="allowed relative slowdown"
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=MIN_DELTA,
+        help="slowdown in seconds below which a part never fails",
+    )
+    parser.add_argument(
+        "--sweep",
+        type=lambda s: [int(n) for n in s.split(",")],
+        help="comma separated input sizes to fit a scaling exponent over",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.sweep:
+        curves = []
+        tasks = discover_parts(args.days)
+        parses = [(day, 0) for day in dict.fromkeys(day for day, _ in tasks)]
+        for day, part in sorted(tasks + parses):
+            curve = sweep_part(
+                day, part, args.sweep, args.seed, args.warmup, args.repeat
+            )
+            print(curve)
+            curves.append(curve)
+        write_results(curves, args.output)
+        return 0
+
+    results = []
+    for day, part in discover_parts(args.days):
+        result = benchmark_part(day, part, args.warmup, args.repeat)
+        print(result)
+        results.append(result)
+    write_results(results, args.output)
+
+    if args.save_baseline:
+        write_results(results, args.baseline)
+        return 0
+    if not os.path.exists(args.baseline):
+        return 0
+    messages = regressions(
+        results, read_results(args.baseline), args.threshold, args.min_delta
+    )
+    for message in messages:
+        print(message)
+    return 1 if messages else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
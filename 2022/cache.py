@@ -0,0 +1,141 @@
+"""Persistent cache of part answers, keyed on the input and the solver's source.
+
+An entry is keyed on (day, part, sha256 of the input, hash of the source of the day
+module and of the local modules it imports), so editing a solver or one of its
+helpers invalidates its answers. Entries are JSON files under .results/, evicted least
+recently used first once there are more than max_entries of them.
+
+Set AOC_NO_CACHE (or pass --no-cache to the runner) to bypass the cache.
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+
+from inputs import MappedInput, write_atomic
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.environ.get("AOC_RESULT_CACHE", os.path.join(DIRECTORY, ".results"))
+MAX_ENTRIES = int(os.environ.get("AOC_RESULT_CACHE_SIZE", 256))
+BYPASS = bool(os.environ.get("AOC_NO_CACHE"))
+
+
+@dataclass
+class Entry:
+    day: int
+    part: int
+    input_hash: str
+    source_hash: str
+    answer: str
+    seconds: float
+
+
+def local_imports(path: str) -> set[str]:
+    """Returns the paths of the modules next to path that it imports."""
+    with open(path) as f:
+        tree = ast.parse(f.read(), filename=path)
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+    paths = (os.path.join(os.path.dirname(path), f"{name}.py") for name in names)
+    return {p for p in paths if os.path.exists(p)}
+
+
+def source_hash(path: str) -> str:
+    """Hashes the source of a module and, recursively, of its local imports."""
+    seen: set[str] = set()
+    pending = [os.path.abspath(path)]
+    while pending:
+        current = pending.pop()
+        if current not in seen:
+            seen.add(current)
+            pending.extend(local_imports(current))
+    digest = hashlib.sha256()
+    for p in sorted(seen):
+        with open(p, "rb") as f:
+            digest.update(os.path.basename(p).encode() + b"\0" + f.read() + b"\0")
+    return digest.hexdigest()
+
+
+def input_hash(data: str | MappedInput) -> str:
+    if isinstance(data, MappedInput):
+        return hashlib.sha256(data.buffer).hexdigest()
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def entry_path(day: int, part: int, input_hash: str, source_hash: str) -> str:
+    key = f"{day}.{part}.{input_hash}.{source_hash}"
+    return os.path.join(CACHE_DIR, hashlib.sha256(key.encode()).hexdigest())
+
+
+def get(day: int, part: int, input_hash: str, source_hash: str) -> Entry | None:
+    path = entry_path(day, part, input_hash, source_hash)
+    try:
+        with open(path) as f:
+            entry = Entry(**json.load(f))
+    except (FileNotFoundError, json.JSONDecodeError, TypeError):
+        return None
+    os.utime(path)
+    return entry
+
+
+def put(entry: Entry, max_entries: int = MAX_ENTRIES) -> None:
+    path = entry_path(entry.day, entry.part, entry.input_hash, entry.source_hash)
+    write_atomic(path, json.dumps(asdict(entry)).encode())
+    evict(max_entries)
+
+
+def entries() -> list[str]:
+    if not os.path.isdir(CACHE_DIR):
+        return []
+    return [
+        os.path.join(CACHE_DIR, name)
+        for name in os.listdir(CACHE_DIR)
+        if not name.endswith(".tmp")
+    ]
+
+
+def evict(max_entries: int = MAX_ENTRIES) -> None:
+    paths = entries()
+    if len(paths) <= max_entries:
+        return
+    paths.sort(key=os.path.getmtime)
+    for path in paths[: len(paths) - max_entries]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def clear() -> None:
+    evict(0)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Inspect the result cache.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("list", help="list the cached answers")
+    subparsers.add_parser("clear", help="remove every entry")
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for path in sorted(entries(), key=os.path.getmtime, reverse=True):
+            with open(path) as f:
+                entry = Entry(**json.load(f))
+            print(
+                f"Day {entry.day:>2} part {entry.part}: {entry.seconds:9.3f}s  "
+                f"{entry.answer}  (input {entry.input_hash[:8]}, "
+                f"source {entry.source_hash[:8]})"
+            )
+    elif args.command == "clear":
+        clear()
+
+
+if __name__ == "__main__":
+    main()
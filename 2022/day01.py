@@ -1,29 +1,100 @@
-from aocd.models import Puzzle
-from typing import Iterable
+import heapq
+from inputs import MappedInput, Puzzle, uint_fields
+from typing import Iterable, Iterator
+
+import numpy as np
 
 puzzle = Puzzle(year=2022, day=1)
 # data = get_data(year=2022, day=1)
 
+MAPPED_INPUT = True
+TOP_K = 3
+# Inputs of at least this many bytes are summed with NumPy instead of line by line.
+NUMPY_THRESHOLD = 1 << 20
+# Bytes of input parsed at once by NumPy, which bounds its temporary arrays.
+CHUNK_SIZE = 1 << 22
+BLANK_LINES = (b"\n\n", b"\n\r\n")
+
+
+def packet_sums(data: str | MappedInput) -> Iterator[int]:
+    total = 0
+    for line in MappedInput.of(data).lines():
+        if line:
+            total += int(line)
+        else:
+            yield total
+            total = 0
+    yield total
+
+
+def top_k_sums(sums: Iterable[int], k: int) -> list[int]:
+    """Returns the k largest sums in ascending order, keeping only k in memory."""
+    heap: list[int] = []
+    for total in sums:
+        if len(heap) < k:
+            heapq.heappush(heap, total)
+        elif total > heap[0]:
+            heapq.heapreplace(heap, total)
+    return sorted(heap)
+
+
+def chunk_group_sums(view: np.ndarray) -> np.ndarray:
+    """Returns the sums of the groups in a uint8 array holding whole groups.
+
+    Blank lines are found as newlines followed by another line ending, and the
+    numbers starting before each give where a group starts. Empty groups are skipped.
+    """
+    values, starts = uint_fields(view)
+    if len(values) == 0:
+        return values
+    newline = view == ord("\n")
+    blank = np.zeros(len(view), dtype=bool)
+    blank[1:] = newline[:-1] & newline[1:]
+    blank[2:] |= newline[:-2] & (view[1:-1] == ord("\r")) & newline[2:]
+    group_starts = np.searchsorted(starts, np.flatnonzero(blank))
+    group_starts = np.append(0, group_starts)
+    new_group = np.diff(group_starts, prepend=-1) > 0
+    group_starts = group_starts[new_group & (group_starts < len(values))]
+    return np.add.reduceat(values, group_starts)
+
+
+def numpy_top_k_sums(data: str | MappedInput, k: int) -> list[int]:
+    """Same as top_k_sums over packet_sums, parsing the numbers with NumPy.
+
+    The mapped input is read in chunks cut at blank lines, so that no group spans two
+    chunks, and only the k largest sums of each chunk are kept.
+    """
+    source = MappedInput.of(data)
+    view = source.array()
+    candidates = []
+    for start, stop in source.chunks(CHUNK_SIZE, BLANK_LINES):
+        sums = chunk_group_sums(view[start:stop])
+        if len(sums) > k:
+            sums = np.partition(sums, -k)[-k:]
+        candidates.extend(sums.tolist())
+    return top_k_sums(candidates, k)
+
 
-def packet_sums(data: str) -> Iterable[int]:
-    return sorted(
-        sum(int(x) for x in packet.split("\n")) for packet in data.split("\n\n")
-    )
+def parse(data: str | MappedInput) -> tuple[int, ...]:
+    if len(MappedInput.of(data)) >= NUMPY_THRESHOLD:
+        return tuple(numpy_top_k_sums(data, TOP_K))
+    return tuple(top_k_sums(packet_sums(data), TOP_K))
 
 
-def part1(data: str) -> str:
-    max_sum = packet_sums(data)[-1]
+def part1(sums: tuple[int, ...]) -> str:
+    max_sum = sums[-1]
     return str(max_sum)
 
 
-def part2(data: str) -> str:
-    top_three_sum = sum(packet_sums(data)[-3:])
+def part2(sums: tuple[int, ...]) -> str:
+    top_three_sum = sum(sums[-3:])
     return str(top_three_sum)
 
 
 if __name__ == "__main__":
+    sums = parse(puzzle.input_data)
     print("--- Part 1 ---")
-    print(part1(puzzle.input_data))
+    print(part1(sums))
     print("--- Part 2 ---")
-    print(part2(puzzle.input_data))
+    print(part2(sums))
     print(puzzle.examples)
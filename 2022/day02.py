@@ -1,3 +1,11 @@
+from collections import Counter
+
+from inputs import MappedInput, Puzzle
+
+puzzle = Puzzle(year=2022, day=2)
+
+MAPPED_INPUT = True
+
 shape_map = {"X": 0, "Y": 1, "Z": 2, "A": 0, "B": 1, "C": 2}
 
 
@@ -23,14 +31,38 @@ def game_score_part2(you, opponent):
         return (shape_map[opponent] + 1) % 3 + 1 + 6
 
 
-total_score = 0
-total_score_part2 = 0
-with open("day-02-input") as f:
-    for line in f:
-        opponent = line[0]
-        you = line[2]
-        total_score += shape_score(you) + game_score(you, opponent)
-        total_score_part2 += game_score_part2(you, opponent)
+# The nine possible rounds, as the raw bytes of an input line.
+PATTERNS = tuple(f"{opponent} {you}".encode() for opponent in "ABC" for you in "XYZ")
+SCORES_PART1 = tuple(
+    shape_score(chr(p[2])) + game_score(chr(p[2]), chr(p[0])) for p in PATTERNS
+)
+SCORES_PART2 = tuple(game_score_part2(chr(p[2]), chr(p[0])) for p in PATTERNS)
+
+
+def parse(data: str | MappedInput) -> tuple[int, ...]:
+    """Counts how often each of the nine rounds is played, in PATTERNS order."""
+    counts = Counter(MappedInput.of(data).lines())
+    unknown = counts.keys() - set(PATTERNS)
+    if unknown:
+        raise ValueError(f"Unexpected rounds: {sorted(unknown)}")
+    return tuple(counts[pattern] for pattern in PATTERNS)
+
+
+def total_score(counts: tuple[int, ...], scores: tuple[int, ...]) -> int:
+    return sum(count * score for count, score in zip(counts, scores))
+
+
+def part1(counts: tuple[int, ...]) -> int:
+    return total_score(counts, SCORES_PART1)
+
+
+def part2(counts: tuple[int, ...]) -> int:
+    return total_score(counts, SCORES_PART2)
+
 
-print(total_score)
-print(total_score_part2)
+if __name__ == "__main__":
+    counts = parse(puzzle.input_data)
+    print("--- Part 1 ---")
+    print(part1(counts))
+    print("--- Part 2 ---")
+    print(part2(counts))
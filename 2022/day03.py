@@ -1,21 +1,53 @@
+from functools import reduce
+from operator import or_
+
+from inputs import Puzzle
+
+puzzle = Puzzle(year=2022, day=3)
+
+alphabet = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Maps a byte to the bit of its item type, so that a priority is the bit's length.
+ITEM_BITS = tuple(
+    1 << alphabet.index(chr(b)) if chr(b) in alphabet else 0 for b in range(256)
+)
+
+Compartments = tuple[int, int]
+
+
 def grouped(iterable, n):
     return zip(*[iter(iterable)] * n)
 
 
-with open("day03-input") as f:
-    lines = f.read().splitlines()
+def item_mask(items: bytes) -> int:
+    return reduce(or_, map(ITEM_BITS.__getitem__, items), 0)
 
-alphabet = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
-total = 0
-total_part2 = 0
-for l1, l2, l3 in grouped(lines, 3):
-    badge = (set(l1) & set(l2) & set(l3)).pop()
-    total_part2 += alphabet.index(badge) + 1
-    for line in (l1, l2, l3):
-        n = len(line)
-        c1 = line[: n // 2]
-        c2 = line[n // 2 :]
-        common = (set(c1) & set(c2)).pop()
-        total += alphabet.index(common) + 1
-print(total)
-print(total_part2)
+
+def priority(mask: int) -> int:
+    """Returns the priority of the single item type in a mask."""
+    return mask.bit_length()
+
+
+def parse(data: str) -> tuple[Compartments, ...]:
+    rucksacks = []
+    for line in data.encode().splitlines():
+        n = len(line) // 2
+        rucksacks.append((item_mask(line[:n]), item_mask(line[n:])))
+    return tuple(rucksacks)
+
+
+def part1(rucksacks: tuple[Compartments, ...]) -> int:
+    return sum(priority(c1 & c2) for c1, c2 in rucksacks)
+
+
+def part2(rucksacks: tuple[Compartments, ...]) -> int:
+    masks = (c1 | c2 for c1, c2 in rucksacks)
+    return sum(priority(m1 & m2 & m3) for m1, m2, m3 in grouped(masks, 3))
+
+
+if __name__ == "__main__":
+    rucksacks = parse(puzzle.input_data)
+    print("--- Part 1 ---")
+    print(part1(rucksacks))
+    print("--- Part 2 ---")
+    print(part2(rucksacks))
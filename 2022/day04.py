@@ -1,5 +1,19 @@
-with open("day04-input") as f:
-    lines = f.read().splitlines()
+from typing import Iterable, Iterator, NamedTuple
+
+import numpy as np
+
+import instrument
+from inputs import MappedInput, Puzzle, uint_fields
+from instrument import TRACE
+
+puzzle = Puzzle(year=2022, day=4)
+
+MAPPED_INPUT = True
+
+Interval = tuple[int, int]
+
+# Bytes of input parsed at once, which bounds the temporary arrays of parse.
+CHUNK_SIZE = 1 << 22
 
 
 def contains_fully(a, b):
@@ -17,22 +31,136 @@ def contains(a, b):
 def overlaps(a, b):
     start_a, stop_a = a
     start_b, stop_b = b
-    print(" " * (start_a - 1), end="")
-    print("-" * (stop_a - start_a + 1))
-    print(" " * (start_b - 1), end="")
-    print("-" * (stop_b - start_b + 1))
+    if instrument.enabled(TRACE):
+        instrument.event(TRACE, "pair", a=a, b=b)
     return contains(a, b) or contains(b, a)
 
 
-total_contains = 0
-total_overlaps = 0
-for line in lines:
-    x1, x2 = line.split(",")
-    i1 = [int(n) for n in x1.split("-")]
-    i2 = [int(n) for n in x2.split("-")]
-    if contains_fully(i1, i2) or contains_fully(i2, i1):
-        total_contains += 1
-    if overlaps(i1, i2):
-        total_overlaps += 1
-print(total_contains)
-print(total_overlaps)
+def parse(data: str | MappedInput) -> np.ndarray:
+    """Returns a read-only (N, 4) array with the bounds of both ranges of each pair."""
+    source = MappedInput.of(data)
+    view = source.array()
+    chunks = [
+        uint_fields(view[start:stop])[0] for start, stop in source.chunks(CHUNK_SIZE)
+    ]
+    bounds = np.concatenate(chunks or [np.empty(0, np.int64)]).reshape(-1, 4)
+    bounds.flags.writeable = False
+    return bounds
+
+
+def pairs(bounds: np.ndarray) -> list[tuple[Interval, Interval]]:
+    return [((a, b), (c, d)) for a, b, c, d in bounds.tolist()]
+
+
+def count_contained(bounds: np.ndarray) -> int:
+    start_a, stop_a, start_b, stop_b = bounds.T
+    a_contains_b = (start_a <= start_b) & (stop_b <= stop_a)
+    b_contains_a = (start_b <= start_a) & (stop_a <= stop_b)
+    return int(np.count_nonzero(a_contains_b | b_contains_a))
+
+
+def count_overlapping(bounds: np.ndarray) -> int:
+    start_a, stop_a, start_b, stop_b = bounds.T
+    return int(np.count_nonzero((start_a <= stop_b) & (start_b <= stop_a)))
+
+
+class IntervalNode(NamedTuple):
+    """A node of a centered interval tree.
+
+    The node holds the intervals containing its center, as (start, stop, id) sorted
+    by ascending start and by descending stop. Intervals entirely before the center
+    are in the left subtree, and those entirely after it in the right subtree.
+    """
+
+    center: int
+    by_start: list[tuple[int, int, int]]
+    by_stop: list[tuple[int, int, int]]
+    left: "IntervalNode | None"
+    right: "IntervalNode | None"
+
+
+def build_tree(intervals: list[tuple[int, int, int]]) -> IntervalNode | None:
+    if not intervals:
+        return None
+    endpoints = sorted(bound for start, stop, _ in intervals for bound in (start, stop))
+    # The median endpoint belongs to an interval, so every node holds at least one.
+    center = endpoints[len(endpoints) // 2]
+    before = [i for i in intervals if i[1] < center]
+    after = [i for i in intervals if i[0] > center]
+    here = [i for i in intervals if i[0] <= center <= i[1]]
+    return IntervalNode(
+        center,
+        sorted(here),
+        sorted(here, key=lambda i: i[1], reverse=True),
+        build_tree(before),
+        build_tree(after),
+    )
+
+
+class IntervalIndex:
+    """Answers which intervals cover a section, or overlap a range.
+
+    The intervals are identified by their position in the list they were built
+    from. Queries visit O(log n) nodes on top of the k intervals they report.
+    """
+
+    def __init__(self, intervals: Iterable[Interval]) -> None:
+        self.root = build_tree(
+            [(start, stop, i) for i, (start, stop) in enumerate(intervals)]
+        )
+
+    def overlapping(self, start: int, stop: int) -> Iterator[int]:
+        """Yields the ids of the intervals sharing a section with [start, stop]."""
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            if stop < node.center:
+                for i_start, _, i in node.by_start:
+                    if i_start > stop:
+                        break
+                    yield i
+                stack.append(node.left)
+            elif start > node.center:
+                for _, i_stop, i in node.by_stop:
+                    if i_stop < start:
+                        break
+                    yield i
+                stack.append(node.right)
+            else:
+                yield from (i for _, _, i in node.by_start)
+                stack.append(node.left)
+                stack.append(node.right)
+
+    def covering(self, section: int) -> Iterator[int]:
+        """Yields the ids of the intervals containing the section."""
+        return self.overlapping(section, section)
+
+
+def assignments(bounds: np.ndarray) -> list[Interval]:
+    """Returns every assignment, the two of pair p being at 2p and 2p + 1."""
+    return [(start, stop) for start, stop in bounds.reshape(-1, 2).tolist()]
+
+
+def pairs_overlapping(index: IntervalIndex, ranges: Iterable[Interval]) -> set[int]:
+    """Returns the pairs with an assignment overlapping any of the ranges."""
+    return {i // 2 for start, stop in ranges for i in index.overlapping(start, stop)}
+
+
+def part1(bounds: np.ndarray) -> int:
+    return count_contained(bounds)
+
+
+def part2(bounds: np.ndarray) -> int:
+    if instrument.enabled(TRACE):
+        return sum(overlaps(i1, i2) for i1, i2 in pairs(bounds))
+    return count_overlapping(bounds)
+
+
+if __name__ == "__main__":
+    bounds = parse(puzzle.input_data)
+    print("--- Part 1 ---")
+    print(part1(bounds))
+    print("--- Part 2 ---")
+    print(part2(bounds))
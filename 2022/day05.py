@@ -1,54 +1,87 @@
+import random
 import re
+from itertools import islice
+from typing import Iterable, Iterator
+
+import instrument
+from inputs import Puzzle
+from instrument import TRACE
+
+puzzle = Puzzle(year=2022, day=5)
+
+Move = tuple[int, int, int]
+Parsed = tuple[tuple[str, ...], str]
+
+# The CrateMover 9000 moves crates one at a time, reversing their order, while the
+# CrateMover 9001 moves them all at once.
+CRATE_MOVER_9000 = 9000
+CRATE_MOVER_9001 = 9001
+
+MOVE_PATTERN = re.compile(r"move (\d+) from (\d+) to (\d+)")
+
+
+def iter_moves(procedure: str) -> Iterator[Move]:
+    """Yields the (n, from, to) moves of the procedure as they are read."""
+    for match in MOVE_PATTERN.finditer(procedure):
+        n, i1, i2 = match.groups()
+        yield int(n), int(i1), int(i2)
 
 
 class Stacks:
-    def __init__(self, path, n_stacks=9):
-        self.n_stacks = n_stacks
-        self.stacks = [[] for i in range(self.n_stacks)]
-        self._read_file(path)
-        self._init_stacks()
-
-    def _read_file(self, path):
-        with open(path) as f:
-            lines = f.read().splitlines()
-        self.initial_stack_lines = lines[:8]
-        self.moves = lines[10:]
-
-    def _init_stacks(self):
-        for line in self.initial_stack_lines[::-1]:
-            for i, c in enumerate(line[1::4]):
-                if c != " ":
-                    self.stacks[i].append(c)
+    def __init__(
+        self,
+        stacks: tuple[str, ...],
+        moves: Iterable[Move] = (),
+        model: int = CRATE_MOVER_9001,
+    ):
+        if model not in (CRATE_MOVER_9000, CRATE_MOVER_9001):
+            raise ValueError(f"Unknown CrateMover model {model}")
+        self.n_stacks = len(stacks)
+        self.stacks = [list(s) for s in stacks]
+        self.moves = moves
+        self.model = model
 
     def move(self, n, i1, i2):
-        remainder, to_move = self.stacks[i1][:-n], self.stacks[i1][-n:]
-        self.stacks[i1] = remainder
-        self.stacks[i2].extend(to_move)
+        if n == 0:
+            return
+        source = self.stacks[i1]
+        if self.model == CRATE_MOVER_9000:
+            self.stacks[i2].extend(reversed(source[-n:]))
+        else:
+            self.stacks[i2].extend(source[-n:])
+        del source[-n:]
 
     def execute_moves(self, n_moves=None):
-        moveset = self.moves if n_moves is None else self.moves[:n_moves]
-        for i, line in enumerate(moveset):
-            print(i, line)
-            n, i1, i2 = [int(x) for x in re.findall("[0-9]+", line)]
+        moveset = islice(self.moves, n_moves)
+        trace = instrument.enabled(TRACE)
+        for i, (n, i1, i2) in enumerate(moveset):
             self.move(n, i1 - 1, i2 - 1)
-            print(self)
+            if trace:
+                instrument.event(TRACE, "move", i=i, move=(n, i1, i2), stacks=str(self))
 
     @property
     def max_len(self):
         return max([len(s) for s in self.stacks])
 
+    @property
+    def top(self) -> str:
+        return "".join(s[-1] for s in self.stacks if s)
+
+    def columns(self) -> list[list[str]]:
+        """Returns the crates of every stack, bottom crate first."""
+        return self.stacks
+
     def print_top(self):
-        for s in self.stacks:
-            print(s[-1], end="")
-        print()
+        print(self.top)
 
     def __str__(self):
+        columns = self.columns()
         lines = ["".join(f" {i+1} " for i in range(self.n_stacks))]
         for level in range(self.max_len):
             line = []
             for i in range(self.n_stacks):
                 try:
-                    s = f"[{self.stacks[i][level]}]"
+                    s = f"[{columns[i][level]}]"
                 except IndexError:
                     s = "   "
                 line.append(s)
@@ -56,8 +89,180 @@ class Stacks:
         return "\n".join(lines[::-1])
 
 
-s = Stacks("day05-input")
-# s = Stacks('tmp', 3)
-print(s)
-s.execute_moves()
-s.print_top()
+class RopeNode:
+    """A node of an implicit treap, ordered by position rather than by key.
+
+    A flipped node has its whole subtree reversed, which is only applied to its
+    children when the node is next visited.
+    """
+
+    __slots__ = ("crate", "priority", "size", "flipped", "left", "right")
+
+    def __init__(self, crate: str, priority: float) -> None:
+        self.crate = crate
+        self.priority = priority
+        self.size = 1
+        self.flipped = False
+        self.left: RopeNode | None = None
+        self.right: RopeNode | None = None
+
+
+Rope = RopeNode | None
+
+
+def rope_size(rope: Rope) -> int:
+    return rope.size if rope is not None else 0
+
+
+def push_flip(node: RopeNode) -> None:
+    if node.flipped:
+        node.left, node.right = node.right, node.left
+        for child in (node.left, node.right):
+            if child is not None:
+                child.flipped = not child.flipped
+        node.flipped = False
+
+
+def update_size(node: RopeNode) -> None:
+    node.size = 1 + rope_size(node.left) + rope_size(node.right)
+
+
+def split(rope: Rope, k: int) -> tuple[Rope, Rope]:
+    """Splits off the first k crates of the rope."""
+    if rope is None:
+        return None, None
+    push_flip(rope)
+    if rope_size(rope.left) >= k:
+        first, rope.left = split(rope.left, k)
+        update_size(rope)
+        return first, rope
+    rope.right, rest = split(rope.right, k - rope_size(rope.left) - 1)
+    update_size(rope)
+    return rope, rest
+
+
+def merge(first: Rope, second: Rope) -> Rope:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    if first.priority > second.priority:
+        push_flip(first)
+        first.right = merge(first.right, second)
+        update_size(first)
+        return first
+    push_flip(second)
+    second.left = merge(first, second.left)
+    update_size(second)
+    return second
+
+
+def last_crate(rope: RopeNode) -> str:
+    while True:
+        push_flip(rope)
+        if rope.right is None:
+            return rope.crate
+        rope = rope.right
+
+
+def rope_crates(rope: Rope) -> Iterator[str]:
+    """Yields the crates of the rope in order."""
+    path = []
+    while path or rope is not None:
+        if rope is not None:
+            push_flip(rope)
+            path.append(rope)
+            rope = rope.left
+        else:
+            node = path.pop()
+            yield node.crate
+            rope = node.right
+
+
+class RopeStacks(Stacks):
+    """Stacks kept as ropes, for moves of many crates at once.
+
+    Each stack is an implicit treap, so a move splits the moved crates off the
+    source and merges them onto the target in O(log n), whatever their number. The
+    CrateMover 9000 reversal only flags the moved subtree. Crates are read back by
+    walking the trees, and only for the tops when printing the answer.
+    """
+
+    def __init__(
+        self,
+        stacks: tuple[str, ...],
+        moves: Iterable[Move] = (),
+        model: int = CRATE_MOVER_9001,
+        seed: int = 0,
+    ):
+        super().__init__(stacks, moves, model)
+        self.rng = random.Random(seed)
+        self.stacks = [self.build(s) for s in stacks]
+
+    def build(self, crates: str) -> Rope:
+        rope = None
+        for crate in crates:
+            rope = merge(rope, RopeNode(crate, self.rng.random()))
+        return rope
+
+    def move(self, n, i1, i2):
+        if n == 0 or i1 == i2:
+            return
+        source = self.stacks[i1]
+        rest, moved = split(source, rope_size(source) - n)
+        if moved is not None and self.model == CRATE_MOVER_9000:
+            moved.flipped = not moved.flipped
+        self.stacks[i1] = rest
+        self.stacks[i2] = merge(self.stacks[i2], moved)
+
+    @property
+    def max_len(self):
+        return max([rope_size(s) for s in self.stacks])
+
+    @property
+    def top(self) -> str:
+        return "".join(last_crate(s) for s in self.stacks if s is not None)
+
+    def columns(self) -> list[list[str]]:
+        return [list(rope_crates(s)) for s in self.stacks]
+
+
+def parse(data: str) -> Parsed:
+    """Returns the stacks, bottom crate first, and the procedure.
+
+    The procedure is kept as text and its moves are read with iter_moves while
+    they are executed, rather than being held in a list.
+    """
+    drawing, procedure = data.split("\n\n")
+    *stack_lines, numbers = drawing.splitlines()
+    stacks = ["" for _ in numbers.split()]
+    for line in stack_lines[::-1]:
+        for i, c in enumerate(line[1::4]):
+            if c != " ":
+                stacks[i] += c
+    return tuple(stacks), procedure
+
+
+def rearrange(parsed: Parsed, model: int, backend: type[Stacks] = Stacks) -> str:
+    """Runs the procedure with the given model, on list stacks or RopeStacks."""
+    stacks, procedure = parsed
+    s = backend(stacks, iter_moves(procedure), model)
+    s.execute_moves()
+    return s.top
+
+
+def part1(parsed: Parsed) -> str:
+    return rearrange(parsed, CRATE_MOVER_9000)
+
+
+def part2(parsed: Parsed) -> str:
+    return rearrange(parsed, CRATE_MOVER_9001)
+
+
+if __name__ == "__main__":
+    parsed = parse(puzzle.input_data)
+    print(Stacks(parsed[0]))
+    print("--- Part 1 ---")
+    print(part1(parsed))
+    print("--- Part 2 ---")
+    print(part2(parsed))
@@ -1,10 +1,99 @@
-with open("day06-input") as f:
-    message = f.read()
-
-marker_len = 14
-for i in range(len(message)):
-    sub = message[i : i + marker_len]
-    # print(sub)
-    if len(set(sub)) == marker_len:
-        print(sub, i + marker_len)
-        break
+import asyncio
+from typing import AsyncIterator, BinaryIO, Iterable, Iterator
+
+from inputs import MappedInput, Puzzle
+
+puzzle = Puzzle(year=2022, day=6)
+
+MAPPED_INPUT = True
+
+START_OF_PACKET = 4
+START_OF_MESSAGE = 14
+CHUNK_SIZE = 1 << 16
+
+
+class MarkerDetector:
+    """Finds markers in a message fed in chunks of any size.
+
+    last_seen holds the latest index of every byte value, and start the first index
+    of the longest run of distinct bytes ending at the current one. A marker ends
+    wherever that run is at least marker_len long. Indices count from the start of
+    the message, so the state carries over from one chunk to the next.
+    """
+
+    def __init__(self, marker_len: int) -> None:
+        if marker_len < 1:
+            raise ValueError(f"Invalid marker length {marker_len}.")
+        self.marker_len = marker_len
+        self.last_seen = [-1] * 256
+        self.start = 0
+        self.offset = 0
+
+    def feed(self, chunk: bytes | memoryview) -> Iterator[int]:
+        """Yields the position after each marker ending in the chunk.
+
+        The state advances as the positions are consumed.
+        """
+        last_seen, start, marker_len = self.last_seen, self.start, self.marker_len
+        end = self.offset + len(chunk)
+        for i, b in enumerate(chunk, self.offset):
+            if last_seen[b] >= start:
+                start = last_seen[b] + 1
+            last_seen[b] = i
+            if i - start + 1 >= marker_len:
+                self.start, self.offset = start, i + 1
+                yield i + 1
+        self.start, self.offset = start, end
+
+
+def marker_positions(message: bytes | memoryview, marker_len: int) -> Iterator[int]:
+    """Yields the position after each marker, in a single pass over the message."""
+    return MarkerDetector(marker_len).feed(message)
+
+
+def read_chunks(f: BinaryIO, size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    while chunk := f.read(size):
+        yield chunk
+
+
+def stream_markers(chunks: Iterable[bytes], marker_len: int) -> Iterator[int]:
+    """Yields marker positions as soon as the chunk holding their end is read."""
+    detector = MarkerDetector(marker_len)
+    for chunk in chunks:
+        yield from detector.feed(chunk)
+
+
+async def astream_markers(
+    reader: asyncio.StreamReader, marker_len: int, size: int = CHUNK_SIZE
+) -> AsyncIterator[int]:
+    """Same as stream_markers, reading the chunks from an asyncio stream."""
+    detector = MarkerDetector(marker_len)
+    while chunk := await reader.read(size):
+        for position in detector.feed(chunk):
+            yield position
+
+
+def find_marker(message: bytes | memoryview, marker_len: int) -> int:
+    for position in marker_positions(message, marker_len):
+        return position
+    raise ValueError(f"No marker of length {marker_len} in message.")
+
+
+def parse(data: str | MappedInput) -> memoryview:
+    return MappedInput.of(data).view()
+
+
+def part1(message: memoryview) -> int:
+    return find_marker(message, START_OF_PACKET)
+
+
+def part2(message: memoryview) -> int:
+    return find_marker(message, START_OF_MESSAGE)
+
+
+if __name__ == "__main__":
+    message = parse(puzzle.input_data)
+    print("--- Part 1 ---")
+    print(part1(message))
+    print("--- Part 2 ---")
+    print(part2(message))
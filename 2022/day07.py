@@ -1,11 +1,20 @@
-from typing import Self, Optional
+from bisect import bisect_left
+from typing import Iterator, Optional, Self
+
+import instrument
+from inputs import Puzzle
+from instrument import DEBUG, TRACE
+
+puzzle = Puzzle(year=2022, day=7)
 
 
 class Directory:
     def __init__(self, name: str, parent: Optional[Self]) -> None:
         self.name = name
         self._parent = parent
-        self.children = []
+        self.children: dict[str, Directory | File] = dict()
+        # The total size of the files below, kept up to date by add_size.
+        self.size = 0
 
     @property
     def parent(self) -> Self:
@@ -13,44 +22,17 @@ class Directory:
             raise FileNotFoundError(f"{self.name} has no parent directory.")
         return self._parent
 
-    @property
-    def size(self) -> int:
-        total_size = 0
-        for child in self.children:
-            total_size += child.size
-        return total_size
-
-    def print(self, level: int) -> None:
-        print(2 * level * " " + f"- {self.name} (dir, size={self.size})")
-        for child in self.children:
-            child.print(level + 1)
-
-    def get_small_dirs(self, threshold: int) -> tuple[int, list[int]]:
-        total_size = 0
-        small_dirs = []
-        for child in self.children:
-            if isinstance(child, File):
-                total_size += child.size
-                continue
-            child_size, child_small_dirs = child.get_small_dirs(threshold)
-            total_size += child_size
-            small_dirs.extend(child_small_dirs)
-        if total_size <= threshold:
-            small_dirs.append(total_size)
-        return total_size, small_dirs
-
-    def get_sizes(self) -> tuple[int, list[int]]:
-        total_size = 0
-        dir_sizes = []
-        for child in self.children:
-            if isinstance(child, File):
-                total_size += child.size
-                continue
-            child_size, child_dir_sizes = child.get_sizes()
-            total_size += child_size
-            dir_sizes.extend(child_dir_sizes)
-        dir_sizes.append(total_size)
-        return total_size, dir_sizes
+    def add_size(self, delta: int) -> None:
+        """Adds delta to the size of this directory and of all its ancestors."""
+        directory = self
+        while directory is not None:
+            directory.size += delta
+            directory = directory._parent
+
+    def render(self, level: int) -> Iterator[str]:
+        yield 2 * level * " " + f"- {self.name} (dir, size={self.size})"
+        for child in self.children.values():
+            yield from child.render(level + 1)
 
 
 class File:
@@ -59,14 +41,15 @@ class File:
         self.parent = parent
         self.size = size
 
-    def print(self, level: int) -> None:
-        print(2 * level * " " + f"- {self.name} (file, size={self.size})")
+    def render(self, level: int) -> Iterator[str]:
+        yield 2 * level * " " + f"- {self.name} (file, size={self.size})"
 
 
 class FileExplorer:
     def __init__(self) -> None:
         self.root = Directory("/", None)
         self.cwd = self.root
+        self.directories = [self.root]
 
     def cd(self, path) -> None:
         if path == "..":
@@ -75,53 +58,72 @@ class FileExplorer:
         if path == "/":
             self.cwd = self.root
             return
-        for child in self.cwd.children:
-            if child.name == path:
-                self.cwd = child
-                return
+        child = self.cwd.children.get(path)
+        if isinstance(child, Directory):
+            self.cwd = child
+            return
         raise FileNotFoundError(f"No such file or directory: {path} in {self.cwd.name}")
 
     def ls(self):
-        for child in self.cwd.children:
+        for child in self.cwd.children.values():
             if isinstance(child, Directory):
                 print(f"dir {child.name}")
             else:
                 print(f"{child.size} {child.name}")
 
     def touch(self, name: str, size: int):
-        new_file = File(name, self.cwd, size)
-        self.cwd.children.append(new_file)
+        """Creates the file, or sets its size if it was already listed."""
+        previous = self.cwd.children.get(name)
+        self.cwd.children[name] = File(name, self.cwd, size)
+        self.cwd.add_size(size - (previous.size if previous is not None else 0))
 
     def mkdir(self, name: str):
-        new_dir = Directory(name, self.cwd)
-        self.cwd.children.append(new_dir)
+        """Creates the directory, keeping its contents if it was already listed."""
+        if name not in self.cwd.children:
+            new_dir = Directory(name, self.cwd)
+            self.cwd.children[name] = new_dir
+            self.directories.append(new_dir)
 
     def print_tree(self):
-        self.root.print(0)
+        print(self)
+
+    def dir_sizes(self) -> list[int]:
+        return [d.size for d in self.directories]
 
     def sum_under_threshold(self, threshold):
-        total_size, small_dirs = self.root.get_small_dirs(threshold)
-        return small_dirs
+        return [size for size in self.dir_sizes() if size <= threshold]
 
     def find_smallest_to_delete(self):
-        total_size, dir_sizes = self.root.get_sizes()
+        total_size = self.root.size
         free_space = 70_000_000 - total_size
         space_needed = 30_000_000 - free_space
-        print(f"{total_size=} {free_space=} {space_needed=}")
-        for dir_size in sorted(dir_sizes):
-            if dir_size >= space_needed:
-                print(dir_size)
-                return dir_size
-
-
-def construct_file_tree(path):
-    with open(path) as f:
-        lines = f.read().splitlines()
-
+        instrument.event(
+            DEBUG,
+            "space",
+            total_size=total_size,
+            free_space=free_space,
+            space_needed=space_needed,
+        )
+        dir_sizes = sorted(self.dir_sizes())
+        i = bisect_left(dir_sizes, space_needed)
+        if i < len(dir_sizes):
+            return dir_sizes[i]
+
+    def __str__(self) -> str:
+        return "\n".join(self.root.render(0))
+
+
+def construct_file_tree(data: str) -> FileExplorer:
+    """Replays the transcript in a single pass over its lines.
+
+    Listings are idempotent, so listing a directory again does not count its
+    contents twice.
+    """
     explorer = FileExplorer()
-    while lines:
-        line = lines.pop(0)
-        print(line)
+    trace = instrument.enabled(TRACE)
+    for line in data.splitlines():
+        if trace:
+            instrument.event(TRACE, "line", line=line)
         if line[0] == "$":
             command = line[2:4]
             if command == "cd":
@@ -133,8 +135,26 @@ def construct_file_tree(path):
             explorer.mkdir(name)
         else:
             explorer.touch(name, int(size_or_dir))
-    explorer.print_tree()
-    explorer.find_smallest_to_delete()
+    if instrument.enabled(DEBUG):
+        instrument.event(DEBUG, "tree", tree=str(explorer))
+    return explorer
+
+
+def parse(data: str) -> FileExplorer:
+    return construct_file_tree(data)
+
+
+def part1(explorer: FileExplorer) -> int:
+    return sum(explorer.sum_under_threshold(100_000))
+
+
+def part2(explorer: FileExplorer) -> int:
+    return explorer.find_smallest_to_delete()
 
 
-construct_file_tree("day07-input")
+if __name__ == "__main__":
+    explorer = parse(puzzle.input_data)
+    print("--- Part 1 ---")
+    print(part1(explorer))
+    print("--- Part 2 ---")
+    print(part2(explorer))
@@ -1,5 +1,10 @@
 import numpy as np
 
+from grid import DIGITS, Grid
+from inputs import Puzzle
+
+puzzle = Puzzle(year=2022, day=8)
+
 
 class bcolors:
     HEADER = "\033[95m"
@@ -82,13 +87,12 @@ class GridIterator:
 
     @property
     def scenic_score(self) -> int:
-        return self.U * self.D * self.L * self.r
+        return self.U * self.D * self.L * self.R
 
 
-def load_grid(path: str) -> np.ndarray:
-    with open(path) as f:
-        lines = f.read().splitlines()
-    grid = np.array([[int(c) for c in line] for line in lines])
+def parse(data: str) -> np.ndarray:
+    grid = Grid.parse(data, DIGITS).values
+    grid.flags.writeable = False
     return grid
 
 
@@ -134,7 +138,7 @@ def visible_trees(grid: np.ndarray) -> np.ndarray:
 
 
 def get_scenic_score(grid: np.ndarray) -> np.ndarray:
-    scenic = np.zeros_like(grid)
+    scenic = np.zeros(grid.shape, dtype=int)
     n, m = grid.shape
     for i in range(n):
         for j in range(m):
@@ -145,9 +149,18 @@ def get_scenic_score(grid: np.ndarray) -> np.ndarray:
     return scenic
 
 
-grid = load_grid("day08-input")
-visible = visible_trees(grid)
-scenic = get_scenic_score(grid)
-print_grid_visibility(grid, visible)
-print(f"Number of visible trees from outside grid: {np.sum(visible)}")
-print(f"Highest scenic score: {np.max(scenic)}")
+def part1(grid: np.ndarray) -> int:
+    return int(np.sum(visible_trees(grid)))
+
+
+def part2(grid: np.ndarray) -> int:
+    return int(np.max(get_scenic_score(grid)))
+
+
+if __name__ == "__main__":
+    grid = parse(puzzle.input_data)
+    print_grid_visibility(grid, visible_trees(grid))
+    print("--- Part 1 ---")
+    print(part1(grid))
+    print("--- Part 2 ---")
+    print(part2(grid))
@@ -1,4 +1,8 @@
-from typing import Self, Callable, Iterator
+from typing import Self, Callable, Iterable
+
+from inputs import Puzzle
+
+puzzle = Puzzle(year=2022, day=9)
 
 
 class Knot:
@@ -140,20 +144,11 @@ class Rope:
 
 
 class RopeSimulator:
-    def __init__(self, path: str, rope_length: int) -> None:
-        self.moves = self.move_generator(path)
+    def __init__(self, moves: Iterable[tuple[str, int]], rope_length: int) -> None:
+        self.moves = moves
         self.rope = Rope(rope_length)
 
-    @staticmethod
-    def move_generator(path: str) -> Iterator[tuple[str, int]]:
-        with open(path) as f:
-            moves = f.read().splitlines()
-
-        for move in moves:
-            direction, steps = move.split(" ")
-            yield direction, int(steps)
-
-    def simulate(self) -> None:
+    def simulate(self) -> int:
         for direction, n in self.moves:
             match direction:
                 case "U":
@@ -164,9 +159,28 @@ class RopeSimulator:
                     self.rope.L(n)
                 case "R":
                     self.rope.R(n)
-        print(f"Number of unique tail positions: {self.rope.unique_tail_positions}")
-        print(self.rope)
+        return self.rope.unique_tail_positions
+
+
+def parse(data: str) -> tuple[tuple[str, int], ...]:
+    moves = []
+    for move in data.splitlines():
+        direction, steps = move.split(" ")
+        moves.append((direction, int(steps)))
+    return tuple(moves)
+
+
+def part1(moves: tuple[tuple[str, int], ...]) -> int:
+    return RopeSimulator(moves, 2).simulate()
+
+
+def part2(moves: tuple[tuple[str, int], ...]) -> int:
+    return RopeSimulator(moves, 10).simulate()
 
 
-r = RopeSimulator("day09-input", 10)
-r.simulate()
+if __name__ == "__main__":
+    moves = parse(puzzle.input_data)
+    print("--- Part 1 ---")
+    print(part1(moves))
+    print("--- Part 2 ---")
+    print(part2(moves))
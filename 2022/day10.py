@@ -1,5 +1,14 @@
+import instrument
+from inputs import Puzzle
+from instrument import DEBUG
+
+puzzle = Puzzle(year=2022, day=10)
+
+RECORDING_CYCLES = (20, 60, 100, 140, 180, 220)
+
+
 class CPU:
-    def __init__(self, recording_cycles: list[int]) -> None:
+    def __init__(self, recording_cycles: tuple[int, ...]) -> None:
         self.X = 1
         self.cycle_counter = 0
         self.recording_cycles = recording_cycles
@@ -19,7 +28,7 @@ class CPU:
         self.crt.update()
         self.cycle_counter += 1
         if self.cycle_counter in self.recording_cycles:
-            print(self)
+            instrument.event(DEBUG, "recording", cpu=str(self))
             self.signal_strengths.append(self.X * self.cycle_counter)
 
     def parse_instruction(self, instruction: str):
@@ -32,10 +41,8 @@ class CPU:
             V = int(command_args[1])
             self.addx(V)
 
-    def parse_input(self, path: str):
-        with open(path) as f:
-            lines = f.read().splitlines()
-        for line in lines:
+    def run(self, program: tuple[str, ...]):
+        for line in program:
             self.parse_instruction(line)
 
     def __str__(self) -> str:
@@ -75,6 +82,25 @@ class CRT:
         return "".join(lines)
 
 
-cpu = CPU([20, 60, 100, 140, 180, 220])
-cpu.parse_input("day10-input")
-print(cpu)
+def parse(data: str) -> tuple[str, ...]:
+    return tuple(data.splitlines())
+
+
+def part1(program: tuple[str, ...]) -> int:
+    cpu = CPU(RECORDING_CYCLES)
+    cpu.run(program)
+    return sum(cpu.signal_strengths)
+
+
+def part2(program: tuple[str, ...]) -> str:
+    cpu = CPU(RECORDING_CYCLES)
+    cpu.run(program)
+    return str(cpu.crt).rstrip("\n")
+
+
+if __name__ == "__main__":
+    program = parse(puzzle.input_data)
+    print("--- Part 1 ---")
+    print(part1(program))
+    print("--- Part 2 ---")
+    print(part2(program))
@@ -1,6 +1,11 @@
+from dataclasses import dataclass
 from typing import Sequence, Iterable
 from functools import reduce
 
+from inputs import Puzzle
+
+puzzle = Puzzle(year=2022, day=11)
+
 
 class Operation:
     def __init__(self, expression) -> None:
@@ -58,7 +63,11 @@ class Monkey:
     def inspect(self):
         while len(self.items) > 0:
             item = self.items.pop(0)
-            item = self.operation(item) % self.troop.common_divisor
+            item = self.operation(item)
+            if self.troop.relief:
+                item //= 3
+            else:
+                item %= self.troop.common_divisor
             self.num_inspected += 1
             self.test_item(item)
 
@@ -80,24 +89,32 @@ class Monkey:
         return "\n".join(lines) + "\n"
 
 
+@dataclass(frozen=True)
+class MonkeyNote:
+    n: int
+    starting_items: tuple[int, ...]
+    operation: str
+    test: tuple[str, str, str]
+
+
 class Troop:
-    def __init__(self, path) -> None:
+    def __init__(self, notes: Iterable[MonkeyNote], relief: bool = False) -> None:
+        self.relief = relief
         self.monkeys: Sequence[Monkey] = []
-        self.populate(path)
+        self.populate(notes)
         self.common_divisor = self.find_common_divisor()
         self.round_count = 0
 
-    def populate(self, path):
-        with open(path) as f:
-            lines = f.read().splitlines()
-        while lines:
-            n = int(lines[0][7])
-            starting_items = [int(item) for item in lines[1][18:].split(", ")]
-            operation = Operation(lines[2])
-            test = Test(lines[3:6])
-            new_monkey = Monkey(self, n, starting_items, operation, test)
+    def populate(self, notes: Iterable[MonkeyNote]):
+        for note in notes:
+            new_monkey = Monkey(
+                self,
+                note.n,
+                list(note.starting_items),
+                Operation(note.operation),
+                Test(note.test),
+            )
             self.monkeys.append(new_monkey)
-            lines = lines[7:]
 
     def find_common_divisor(self) -> int:
         return reduce(lambda a, b: a * b, [m.test.divisor for m in self.monkeys])
@@ -127,7 +144,32 @@ class Troop:
         return "\n".join(str(m) for m in self.monkeys) + "\n"
 
 
-troop = Troop("day11-input")
-print(troop)
-troop.rounds(10000, print_rounds=[10000])
-print(troop.monkey_business)
+def parse(data: str) -> tuple[MonkeyNote, ...]:
+    notes = []
+    for block in data.split("\n\n"):
+        lines = block.splitlines()
+        n = int(lines[0][7])
+        starting_items = tuple(int(item) for item in lines[1][18:].split(", "))
+        notes.append(MonkeyNote(n, starting_items, lines[2], tuple(lines[3:6])))
+    return tuple(notes)
+
+
+def part1(notes: tuple[MonkeyNote, ...]) -> int:
+    troop = Troop(notes, relief=True)
+    troop.rounds(20)
+    return troop.monkey_business
+
+
+def part2(notes: tuple[MonkeyNote, ...]) -> int:
+    troop = Troop(notes)
+    troop.rounds(10000)
+    return troop.monkey_business
+
+
+if __name__ == "__main__":
+    notes = parse(puzzle.input_data)
+    print(Troop(notes))
+    print("--- Part 1 ---")
+    print(part1(notes))
+    print("--- Part 2 ---")
+    print(part2(notes))
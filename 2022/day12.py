@@ -1,9 +1,20 @@
-from typing import Iterable, Any, Self
-from dataclasses import dataclass
-from functools import total_ordering
+from typing import NamedTuple
+
+import numpy as np
+
+import instrument
+from graphs import ShortestPaths, bfs
+from grid import ORTHOGONAL, Grid, shift
+from inputs import Puzzle
+from instrument import DEBUG
+
+puzzle = Puzzle(year=2022, day=12)
 
 alphabet = "abcdefghijklmnopqrstuvwxyz"
-height_map = {c: i for i, c in enumerate(alphabet)}
+HEIGHTS = {c: i for i, c in enumerate(alphabet)} | {"S": 0, "E": 25}
+
+# The character drawn for a step in direction (di, dj), as seen from its target.
+DIRECTIONS = {(1, 0): "V", (-1, 0): "^", (0, 1): ">", (0, -1): "<"}
 
 
 class bcolors:
@@ -18,229 +29,122 @@ class bcolors:
     UNDERLINE = "\033[4m"
 
 
-@total_ordering
-class Distance:
-    def __init__(self, d: int | str) -> None:
-        if isinstance(d, int) or d == "inf":
-            self.d = d
-        else:
-            raise ValueError(f"d must be in or 'int'. {d=}")
-
-    def __eq__(self, other: "Distance") -> bool:
-        return self.d == other.d
-
-    def __lt__(self, other: "Distance") -> bool:
-        if self.d == "inf":
-            return False
-        if other.d == "inf":
-            return True
-        return self.d < other.d
-
-    def __add__(self, other: int | Self):
-        if self.d == "inf":
-            return Distance("inf")
-        if isinstance(other, int):
-            return Distance(self.d + other)
-        elif isinstance(other, Distance):
-            if other.d == "inf":
-                return Distance("inf")
-            else:
-                return Distance(self.d + other.d)
-        else:
-            raise TypeError(
-                f"Addition is not supported between Distance and {type(other)}."
-            )
-
-    def __str__(self) -> str:
-        return str(self.d)
-
-    def __int__(self) -> int:
-        if self.d == "inf":
-            raise ValueError("Distance with value inf can not be converted to inf.")
-        return self.d
-
-
-@dataclass
-class Node:
-    i: int
-    j: int
-    h: int
-    c: str
-    d: Distance
-    visited: bool = False
-    prev: "Node" = None
-
-    @property
-    def position(self) -> tuple[int, int]:
-        return self.i, self.j
-
-    @property
-    def direction(self) -> str:
-        if self.prev is None:
+class HeightMap(NamedTuple):
+    heights: np.ndarray
+    start: tuple[int, int]
+    end: tuple[int, int]
+
+
+class Dijkstra:
+    """Shortest climbs on the height map, searched breadth first.
+
+    Cells are numbered i * width + j. With reverse the search starts from the end
+    and steps downhill, so that it reaches every possible start at once.
+    """
+
+    def __init__(self, height_map: HeightMap, reverse: bool = False) -> None:
+        self.grid = Grid(height_map.heights)
+        self.start_node = self.node_id(*height_map.start)
+        self.end_node = self.node_id(*height_map.end)
+        self.reverse = reverse
+        self.paths: ShortestPaths | None = None
+
+    def node_id(self, i: int, j: int) -> int:
+        return i * self.grid.width + j
+
+    def position(self, node: int) -> tuple[int, int]:
+        return divmod(node, self.grid.width)
+
+    def adjacency(self) -> list[list[int]]:
+        heights = self.grid.values.astype(np.int16)
+        inside = np.ones(self.grid.shape, dtype=bool)
+        graph: list[list[int]] = [[] for _ in range(heights.size)]
+        for di, dj in ORTHOGONAL:
+            climb = self.grid.shifted(di, dj).astype(np.int16) - heights
+            if self.reverse:
+                climb = -climb
+            allowed = shift(inside, di, dj, fill=False) & (climb <= 1)
+            offset = self.node_id(di, dj)
+            for node in np.flatnonzero(allowed).tolist():
+                graph[node].append(node + offset)
+        return graph
+
+    def solve(self) -> None:
+        source = self.end_node if self.reverse else self.start_node
+        self.paths = bfs(self.adjacency(), source)
+
+    def distance(self, node: int) -> int:
+        return self.paths.dist[node]
+
+    def find_min(self) -> int:
+        """Returns the lowest cell closest to the source of the search."""
+        dist = np.frombuffer(self.paths.dist, dtype=np.int64)
+        lowest = np.flatnonzero(self.grid.values.ravel() == 0)
+        node = int(lowest[np.argmin(dist[lowest])])
+        instrument.event(
+            DEBUG, "closest_start", position=self.position(node), d=self.distance(node)
+        )
+        return node
+
+    def direction(self, node: int) -> str:
+        prev = self.paths.prev[node]
+        if prev == -1:
             return "."
-        i, j = self.position
-        if i == self.prev.i + 1:
-            return "V"
-        elif i == self.prev.i - 1:
-            return "^"
-        elif j == self.prev.j + 1:
-            return ">"
-        elif j == self.prev.j - 1:
-            return "<"
-        else:
-            return "X"
-
-    def __str__(self) -> str:
-        return f"Node(i={self.i}, j={self.j}, h={self.h}, d={self.d})"
-
-
-class Grid:
-    def __init__(self, height: int, width: int, fill: Any = None) -> None:
-        self.height = height
-        self.width = width
-        self.shape = (height, width)
-        self.fill = fill
-        self.values: list[list[Any]] = [
-            [fill for j in range(width)] for i in range(height)
-        ]
-
-    def __getitem__(self, idx: tuple[int, int]):
-        i, j = idx
-        return self.values[i][j]
-
-    def __setitem__(self, idx: tuple[int, int], value: Any):
-        i, j = idx
-        self.values[i][j] = value
-
-    def __str__(self) -> str:
-        lines = ["".join([str(item) for item in row]) + "\n" for row in self.values]
-        return "".join(lines)
-
-    def iter(self):
-        for i in range(self.height):
-            for j in range(self.width):
-                yield self.values[i][j]
+        (i, j), (pi, pj) = self.position(node), self.position(prev)
+        return DIRECTIONS.get((i - pi, j - pj), "X")
+
+    def print_path(self, node: int):
+        print_grid = np.full(self.grid.shape, ".", dtype=object)
+        for step in self.paths.path(node)[1:]:
+            c = self.direction(step)
+            print_grid[self.position(step)] = f"{bcolors.FAIL}{c}{bcolors.ENDC}"
+        print("\n".join("".join(row) for row in print_grid))
+        print(self.distance(node))
+
+    def print_grid(self):
+        print_grid = np.full(self.grid.shape, ".", dtype=object)
+        for node in range(print_grid.size):
+            print_grid[self.position(node)] = self.direction(node)
+        print_grid[self.position(self.end_node)] = f"{bcolors.OKGREEN}E{bcolors.ENDC}"
+        print("\n".join("".join(row) for row in print_grid))
 
     def print_height(self) -> None:
-        height_grid = "".join(
-            ["".join([alphabet[n.h] for n in row]) + "\n" for row in self.values]
-        )
+        height_grid = self.grid.render(alphabet)
         height_grid = "".join(
             [bcolors.FAIL + c + bcolors.ENDC if c == "a" else c for c in height_grid]
         )
         print(height_grid)
 
 
-class Dijkstra:
-    def __init__(self, path: str, reverse: bool = False) -> None:
-        self.reverse = reverse
-        self.load_map(path)
-
-    def load_map(self, path: str, start: str = "S", end: str = "E"):
-        with open(path) as f:
-            lines = f.read().splitlines()
-
-        height = len(lines)
-        width = len(lines[0])
-        self.grid = Grid(height, width)
-        self.unvisited = []
-        for i, line in enumerate(lines):
-            for j, c in enumerate(line):
-                if c == start:
-                    h = 0
-                    d = Distance(0) if not self.reverse else Distance("inf")
-                elif c == end:
-                    h = 25
-                    d = Distance("inf") if not self.reverse else Distance(0)
-                else:
-                    h = height_map[c]
-                    d = Distance("inf")
-                new_node = Node(i, j, h, c, d)
-                self.unvisited.append(new_node)
-                self.grid[i, j] = new_node
-                if c == start:
-                    self.start_node = new_node
-                if c == end:
-                    self.end_node = new_node
-
-    def pop_unvisited(self) -> Node:
-        min_index = 0
-        min_distance = Distance("inf")
-        for i, node in enumerate(self.unvisited):
-            if node.d < min_distance:
-                min_index = i
-                min_distance = node.d
-        return self.unvisited.pop(min_index)
-
-    def valid_step(self, node_from: Node, node_to: Node) -> bool:
-        if not self.reverse:
-            return node_to.h - node_from.h <= 1
-        return node_from.h - node_to.h <= 1
-
-    def neighbors(self, node: Node) -> Iterable[Node]:
-        i, j = node.position
-        if i + 1 < self.grid.height and self.valid_step(node, self.grid[i + 1, j]):
-            yield self.grid[i + 1, j]
-        if j + 1 < self.grid.width and self.valid_step(node, self.grid[i, j + 1]):
-            yield self.grid[i, j + 1]
-        if i > 0 and self.valid_step(node, self.grid[i - 1, j]):
-            yield self.grid[i - 1, j]
-        if j > 0 and self.valid_step(node, self.grid[i, j - 1]):
-            yield self.grid[i, j - 1]
-
-    def solve(self):
-        while len(self.unvisited) > 0:
-            current_node = self.pop_unvisited()
-            new_distance = current_node.d + 1
-            for neighbor in self.neighbors(current_node):
-                if neighbor.visited:
-                    continue
-                if new_distance < neighbor.d:
-                    neighbor.d = new_distance
-                    neighbor.prev = current_node
-            current_node.visited = True
-        self.print_grid()
-        if not self.reverse:
-            self.print_path(self.end_node)
-        else:
-            self.print_path(self.start_node)
-
-    def find_min(self):
-        min_distance = Distance("inf")
-        min_node = None
-        for node in self.grid.iter():
-            if node.h != 0:
-                continue
-            if node.d < min_distance:
-                print(node)
-                min_distance = node.d
-                min_node = node
-        self.print_path(min_node)
-
-    def print_path(self, node: Node):
-        print_grid = Grid(self.grid.height, self.grid.width, fill=".")
-        current_node = node
-        while current_node.prev is not None:
-            i, j = current_node.position
-            c = current_node.direction
-            print_grid[i, j] = f"{bcolors.FAIL}{c}{bcolors.ENDC}"
-            current_node = current_node.prev
-        print(print_grid)
-        print(node.d)
+def parse(data: str) -> HeightMap:
+    """Returns the uint8 heights, read-only, with the start and end positions."""
+    heights = Grid.parse(data, HEIGHTS).values
+    heights.flags.writeable = False
+    raw = Grid.parse(data).values
+    start, end = (tuple(int(x) for x in np.argwhere(raw == ord(c))[0]) for c in "SE")
+    return HeightMap(heights, start, end)
 
-    def print_grid(self):
-        print_grid = Grid(self.grid.height, self.grid.width)
-        for i in range(self.grid.height):
-            for j in range(self.grid.width):
-                if self.grid[i, j] == self.end_node:
-                    print_grid[i, j] = f"{bcolors.OKGREEN}E{bcolors.ENDC}"
-                else:
-                    print_grid[i, j] = self.grid[i, j].direction
-        print(print_grid)
+
+def part1(height_map: HeightMap) -> int:
+    d = Dijkstra(height_map)
+    d.solve()
+    return d.distance(d.end_node)
+
+
+def part2(height_map: HeightMap) -> int:
+    d = Dijkstra(height_map, reverse=True)
+    d.solve()
+    return d.distance(d.find_min())
 
 
 if __name__ == "__main__":
-    d = Dijkstra("day12-input")
+    height_map = parse(puzzle.input_data)
+    d = Dijkstra(height_map)
     d.solve()
+    d.print_grid()
     d.print_path(d.end_node)
-    d.grid.print_height()
+    d.print_height()
+    print("--- Part 1 ---")
+    print(part1(height_map))
+    print("--- Part 2 ---")
+    print(part2(height_map))
@@ -1,6 +1,12 @@
 from typing import Self
 from functools import total_ordering
 
+import instrument
+from inputs import Puzzle
+from instrument import DEBUG
+
+puzzle = Puzzle(year=2022, day=13)
+
 
 @total_ordering
 class Packet:
@@ -75,54 +81,44 @@ class Packet:
         return self.value == other.value
 
 
-def parse_packet_pairs(path: str) -> list[tuple[Packet, Packet]]:
-    with open(path) as f:
-        lines = f.read().splitlines()
+def parse(data: str) -> tuple[tuple[Packet, Packet], ...]:
+    lines = data.splitlines()
     packets = []
     while lines:
         packet1 = Packet(lines.pop(0))
         packet2 = Packet(lines.pop(0))
         if lines:
-            print(len(lines.pop(0)))
+            lines.pop(0)
         packets.append((packet1, packet2))
-    return packets
-
+    return tuple(packets)
 
-def parse_packets(path: str) -> list[Packet]:
-    with open(path) as f:
-        lines = f.read().splitlines()
-    packets = []
-    for line in lines:
-        if len(line) > 0:
-            packets.append(Packet(line))
-    d1 = Packet("[[2]]")
-    d2 = Packet("[[6]]")
-    packets.append(d1)
-    packets.append(d2)
-    return packets, d1, d2
 
-
-def calculate_index_sum(path):
-    packets = parse_packet_pairs(path)
+def part1(pairs: tuple[tuple[Packet, Packet], ...]) -> int:
     total = 0
-    for i, (p1, p2) in enumerate(packets):
-        print(f"== Pair {i+1} ==")
-        print(f"{p1} vs {p2}")
-        if p1 < p2:
-            print("Is ordered")
+    debug = instrument.enabled(DEBUG)
+    for i, (p1, p2) in enumerate(pairs):
+        ordered = p1 < p2
+        if debug:
+            instrument.event(
+                DEBUG, "pair", i=i + 1, left=str(p1), right=str(p2), ordered=ordered
+            )
+        if ordered:
             total += i + 1
-        else:
-            print("Is not ordered")
-        print()
-    print(f"Sum of indices of ordered pairs: {total}")
-
-
-def sort_packets():
-    pass
+    return total
 
 
-packets, d1, d2 = parse_packets("day13-input")
-packets = sorted(packets)
-i1 = packets.index(d1) + 1
-i2 = packets.index(d2) + 1
-print(i1 * i2)
+def part2(pairs: tuple[tuple[Packet, Packet], ...]) -> int:
+    d1 = Packet("[[2]]")
+    d2 = Packet("[[6]]")
+    packets = sorted([p for pair in pairs for p in pair] + [d1, d2])
+    i1 = packets.index(d1) + 1
+    i2 = packets.index(d2) + 1
+    return i1 * i2
+
+
+if __name__ == "__main__":
+    pairs = parse(puzzle.input_data)
+    print("--- Part 1 ---")
+    print(part1(pairs))
+    print("--- Part 2 ---")
+    print(part2(pairs))
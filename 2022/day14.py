@@ -1,55 +1,82 @@
+import instrument
+from grid import Grid
+from inputs import Puzzle
+from instrument import DEBUG, TRACE
+
+puzzle = Puzzle(year=2022, day=14)
+
+RockPath = tuple[tuple[int, int], ...]
+
+EMPTY = 0
+ROCK = 1
+SAND = 2
+CHARS = ".#o"
+
+
 class SandSimulator:
-    def __init__(self, path, floor=False) -> None:
-        self.cave = dict()
-        self.populate_cave(path)
-        self.calculate_bounds()
+    def __init__(self, paths: tuple[RockPath, ...], floor=False) -> None:
+        self.calculate_bounds(paths)
+        # The cave is indexed (y, x), and grows when sand comes to rest outside it.
+        self.cave = Grid.filled(
+            (self.ymax - self.ymin + 1, self.xmax - self.xmin + 1),
+            origin=(self.ymin, self.xmin),
+        )
+        self.populate_cave(paths)
+        self.floor = None
         if floor:
             self.floor = self.ymax + 2
             self.ymax = self.floor
         self.sand_source = (500, 0)
+        # Sand never goes further sideways than down, so growing the cave over that
+        # triangle lets is_blocked skip bounds checks.
+        x, y = self.sand_source
+        self.cave.grow(y, x - self.ymax - 1)
+        self.cave.grow(self.ymax, x + self.ymax + 1)
+        self.view_cells()
 
-    @staticmethod
-    def split_coords(coords):
-        return [int(c) for c in coords.split(",")]
-
-    def populate_cave(self, path):
-        with open(path) as f:
-            lines = f.read().splitlines()
-
-        for line in lines:
-            segments = line.split(" -> ")
-            for start, end in zip(segments[:-1], segments[1:]):
-                print(start, end)
-                x1, y1 = self.split_coords(start)
-                x2, y2 = self.split_coords(end)
-                if x1 == x2:
-                    x = x1
-                    start_y, end_y = min([y1, y2]), max([y1, y2])
-                    for y in range(start_y, end_y + 1):
-                        self.cave[(x, y)] = "#"
-                elif y1 == y2:
-                    y = y1
-                    start_x, end_x = min([x1, x2]), max([x1, x2])
-                    for x in range(start_x, end_x + 1):
-                        self.cave[(x, y)] = "#"
+    def view_cells(self):
+        """Views the cave through a memoryview, much faster to index than NumPy."""
+        self.cells = memoryview(self.cave.values)
+        self.oy, self.ox = self.cave.origin
+
+    def populate_cave(self, paths: tuple[RockPath, ...]):
+        debug = instrument.enabled(DEBUG)
+        for path in paths:
+            for start, end in zip(path[:-1], path[1:]):
+                if debug:
+                    instrument.event(DEBUG, "segment", start=start, end=end)
+                x1, y1 = start
+                x2, y2 = end
+                if x1 == x2 or y1 == y2:
+                    i0, j0 = self.cave.index(min(y1, y2), min(x1, x2))
+                    i1, j1 = self.cave.index(max(y1, y2), max(x1, x2))
+                    self.cave.values[i0 : i1 + 1, j0 : j1 + 1] = ROCK
                 else:
                     raise ValueError("Invalid input file.")
 
-    def calculate_bounds(self):
-        x_values = [r[0] for r in self.cave.keys()]
-        y_values = [r[1] for r in self.cave.keys()]
+    def calculate_bounds(self, paths: tuple[RockPath, ...]):
+        x_values = [x for path in paths for x, _ in path]
+        y_values = [y for path in paths for _, y in path]
         self.xmin = min(x_values)
         self.xmax = max(x_values)
         self.ymin = min(y_values)
         self.ymax = max(y_values)
 
     def cave_lookup(self, x, y):
-        return self.cave.get((x, y), ".")
+        if not self.cave.in_bounds(y, x):
+            return CHARS[EMPTY]
+        return CHARS[self.cave[y, x]]
 
     def is_blocked(self, x, y):
         if self.floor and y == self.floor:
             return True
-        return (x, y) in self.cave
+        return self.cells[y - self.oy, x - self.ox] != EMPTY
+
+    def rest(self, x, y):
+        if not self.cave.in_bounds(y, x):
+            self.cave.grow(y, x)
+            self.view_cells()
+        self.cave[y, x] = SAND
 
     def in_bounds(self, x, y):
         return self.xmin <= x <= self.xmax and y < self.ymax
@@ -70,7 +97,7 @@ class SandSimulator:
             else:
                 stopped = True
         if stopped:
-            self.cave[(x, y)] = "o"
+            self.rest(x, y)
             self.ymin = min(self.ymin, y)
         return stopped
 
@@ -78,8 +105,10 @@ class SandSimulator:
         x, y = self.sand_source
         y = max(y, self.ymin - 1)
         stopped = False
+        trace = instrument.enabled(TRACE)
         while not stopped and not self.is_blocked(x, y):
-            print(x, y)
+            if trace:
+                instrument.event(TRACE, "grain_step", x=x, y=y)
             while not self.is_blocked(x, y + 1):
                 y += 1
             if not self.is_blocked(x - 1, y + 1):
@@ -91,7 +120,7 @@ class SandSimulator:
             else:
                 stopped = True
         if stopped:
-            self.cave[(x, y)] = "o"
+            self.rest(x, y)
             self.ymin = min(self.ymin, y)
             self.xmin = min(self.xmin, x)
             self.xmax = max(self.xmax, x)
@@ -116,11 +145,34 @@ class SandSimulator:
         return "".join(lines)
 
 
-# sim = SandSimulator('tmp', floor=True)
-sim = SandSimulator("day14-input", floor=True)
-total_grains = 0
-while sim.add_grain():
-    total_grains += 1
-    print(total_grains)
-print(sim)
-print(total_grains)
+def count_grains(sim: SandSimulator) -> int:
+    total_grains = 0
+    while sim.add_grain():
+        total_grains += 1
+    return total_grains
+
+
+def parse(data: str) -> tuple[RockPath, ...]:
+    return tuple(
+        tuple(tuple(int(c) for c in coords.split(",")) for coords in line.split(" -> "))
+        for line in data.splitlines()
+    )
+
+
+def part1(paths: tuple[RockPath, ...]) -> int:
+    return count_grains(SandSimulator(paths))
+
+
+def part2(paths: tuple[RockPath, ...]) -> int:
+    return count_grains(SandSimulator(paths, floor=True))
+
+
+if __name__ == "__main__":
+    paths = parse(puzzle.input_data)
+    sim = SandSimulator(paths, floor=True)
+    count_grains(sim)
+    print(sim)
+    print("--- Part 1 ---")
+    print(part1(paths))
+    print("--- Part 2 ---")
+    print(part2(paths))
@@ -1,6 +1,15 @@
 import re
 from typing import Self, Iterable
 
+import instrument
+from inputs import Puzzle
+from instrument import DEBUG, TRACE
+
+puzzle = Puzzle(year=2022, day=15)
+
+Y_LINE = 2_000_000
+SEARCH_BOUNDS = (0, 4_000_000)
+
 
 class bcolors:
     HEADER = "\033[95m"
@@ -73,11 +82,8 @@ def dist(p1: Point, p2: Point) -> int:
     return abs(p1.x - p2.x) + abs(p1.y - p2.y)
 
 
-def load_reports(path: str) -> list[SensorReport]:
-    with open(path) as f:
-        lines = f.read().splitlines()
-    reports = [SensorReport(line) for line in lines]
-    return reports
+def parse(data: str) -> tuple[SensorReport, ...]:
+    return tuple(SensorReport(line) for line in data.splitlines())
 
 
 def num_impossible_positions(reports: Iterable[SensorReport], y_line: int) -> int:
@@ -89,18 +95,25 @@ def num_impossible_positions(reports: Iterable[SensorReport], y_line: int) -> in
     r = reports[0]
     total += 2 * r.adjusted_dist(y_line) + 1
     prev_max = r.sensor.x + r.adjusted_dist(y_line)
-    print(r)
-    print(r.adjusted_dist(y_line))
-    print(r.sensor.x - r.adjusted_dist(y_line), r.sensor.x + r.adjusted_dist(y_line))
+    debug = instrument.enabled(DEBUG)
+    if debug:
+        instrument.event(
+            DEBUG,
+            "covered",
+            sensor=str(r.sensor),
+            start=r.sensor.x - r.adjusted_dist(y_line),
+            end=prev_max,
+        )
     for r in reports[1:]:
         start = max(r.sensor.x - r.adjusted_dist(y_line), prev_max + 1)
         end = r.sensor.x + r.adjusted_dist(y_line)
-        print(r)
-        print(start, end, max(0, end - start + 1))
-        # print(end - start + 1)
+        if debug:
+            instrument.event(
+                DEBUG, "covered", sensor=str(r.sensor), start=start, end=end
+            )
         total += max(0, end - start + 1)
         prev_max = max(prev_max, end)
-    print(total)
+    return total
 
 
 def print_search_space(reports: Iterable[SensorReport], bounds: tuple[int, int]):
@@ -149,8 +162,9 @@ def print_t_dist(r: SensorReport):
     print("".join(lines))
 
 
-def find_beacon(reports: Iterable[SensorReport], bounds: tuple[int, int]) -> int:
+def find_beacon(reports: Iterable[SensorReport], bounds: tuple[int, int]) -> Point:
     l, u = bounds
+    trace = instrument.enabled(TRACE)
     for row in reversed(range(l, 2 * u + 1)):
         if row <= u:
             y = row
@@ -160,7 +174,8 @@ def find_beacon(reports: Iterable[SensorReport], bounds: tuple[int, int]) -> int
             x = row - u
         while y >= 0 and x <= u:
             p = Point(x, y)
-            print(p)
+            if trace:
+                instrument.event(TRACE, "probe", x=x, y=y)
             is_open = True
             for r in reports:
                 if dist(p, r.sensor) <= r.dist:
@@ -170,9 +185,21 @@ def find_beacon(reports: Iterable[SensorReport], bounds: tuple[int, int]) -> int
                     is_open = False
                     break
             if is_open:
-                print(p, 4_000_000 * x + y)
                 return p
 
 
-reports = load_reports("day15-input")
-searched = find_beacon(reports, (0, 4_000_000))
+def part1(reports: tuple[SensorReport, ...]) -> int:
+    return num_impossible_positions(reports, Y_LINE)
+
+
+def part2(reports: tuple[SensorReport, ...]) -> int:
+    p = find_beacon(reports, SEARCH_BOUNDS)
+    return 4_000_000 * p.x + p.y
+
+
+if __name__ == "__main__":
+    reports = parse(puzzle.input_data)
+    print("--- Part 1 ---")
+    print(part1(reports))
+    print("--- Part 2 ---")
+    print(part2(reports))
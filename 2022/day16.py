@@ -3,9 +3,14 @@ from copy import copy
 from dataclasses import dataclass
 from typing import Iterable, Self
 
-from day12 import Distance
+import instrument
+from graphs import all_pairs_bfs
+from inputs import Puzzle
+from instrument import INFO
 
-inf = Distance("inf")
+puzzle = Puzzle(year=2022, day=16)
+
+ValveScan = tuple[str, int, tuple[str, ...]]
 
 
 class Valve:
@@ -50,34 +55,25 @@ class Move:
 
 
 class Graph:
-    def __init__(self, path: str) -> None:
-        self.valves = self.parse_file(path)
+    def __init__(self, scan: Iterable[ValveScan]) -> None:
+        self.valves = self.build_valves(scan)
         self.max_total_flow = 0
         self.n_searched = 0
+        self.count_states = instrument.enabled(INFO)
         self.non_zero_valves = sum(int(v.flowrate > 0) for v in self.valves.values())
         self.max_flow = sum(v.flowrate for v in self.valves.values())
         self.distances = GraphDistances(self)
 
-    def parse_file(self, path: str) -> dict[str, Valve]:
-        with open(path) as f:
-            lines = f.read().splitlines()
-
+    def build_valves(self, scan: Iterable[ValveScan]) -> dict[str, Valve]:
         valves = dict()
-        for line in lines:
-            valve = self.parse_line(line)
-            valves[valve.name] = valve
+        for name, flowrate, downstream_names in scan:
+            valves[name] = Valve(name, flowrate, downstream_names)
 
         for valve in valves.values():
             valve.instanciate_downstream(valves)
 
         return valves
 
-    def parse_line(self, line: str) -> Valve:
-        name = line.split(" ")[1]
-        flowrate = int(re.findall(r"rate=(\d+)", line)[0])
-        downstream_names = re.findall(r"(?:valve |valves )(.+)", line)[0].split(", ")
-        return Valve(name, flowrate, downstream_names)
-
     def flow_potential(
         self, current_valve: Valve, remaining_time: int, open_valves: set[Valve]
     ):
@@ -96,6 +92,8 @@ class Graph:
         open_valves: set[Valve] = None,
         total_flow: int = 0,
     ) -> int:
+        if self.count_states:
+            instrument.count("day16.single_agent_states")
         if remaining_time == 0:
             self.n_searched += 1
             if total_flow > self.max_total_flow:
@@ -176,6 +174,8 @@ class Graph:
         open_valves: set[Valve] = None,
         total_flow: int = 0,
     ) -> int:
+        if self.count_states:
+            instrument.count("day16.multi_agent_states")
         if remaining_time == 0:
             self.n_searched += 1
             if total_flow >= self.max_total_flow:
@@ -276,46 +276,17 @@ class Graph:
         return len(self.valves)
 
 
-@dataclass
-class Node:
-    valve: Valve
-    d: Distance
-    visited: bool = False
-    prev: "Node" = None
-
-
 class GraphDistances:
     def __init__(self, graph: Graph) -> None:
         self.graph = graph
-        self.distances: dict[str, dict[str, Distance]] = {
-            k: self.calculate_distances(v) for k, v in graph.items()
-        }
-
-    def next_unvisited(self, unvisited) -> Node:
-        min_index = 0
-        min_distance = inf
-        for i, node in enumerate(unvisited):
-            if node.d < min_distance:
-                min_index = i
-                min_distance = node.d
-        return unvisited.pop(min_index)
-
-    def calculate_distances(self, start_node: Valve) -> dict[str, int]:
-        nodes = {k: Node(v, inf) for k, v in self.graph.items()}
-        nodes[start_node.name].d = Distance(0)
-        unvisited = [n for n in nodes.values()]
-        while len(unvisited) > 0:
-            current_node = self.next_unvisited(unvisited)
-            new_distance = current_node.d + 1
-            for downstream_name in current_node.valve.downstream:
-                downstream_node = nodes[downstream_name]
-                if downstream_node.visited:
-                    continue
-                if new_distance < downstream_node.d:
-                    downstream_node.d = new_distance
-                    downstream_node.prev = current_node
-            current_node.visited = True
-        return {k: int(n.d) for k, n in nodes.items()}
+        self.distances: dict[str, dict[str, int]] = self.calculate_distances()
+
+    def calculate_distances(self) -> dict[str, dict[str, int]]:
+        names = list(self.graph.valves)
+        ids = {name: i for i, name in enumerate(names)}
+        adjacency = [[ids[name] for name in self.graph[k].downstream] for k in names]
+        table = all_pairs_bfs(adjacency)
+        return {k: dict(zip(names, table[ids[k]])) for k in names}
 
     def __getitem__(self, key: tuple[str, str]) -> int:
         k1, k2 = key
@@ -329,7 +300,28 @@ class GraphDistances:
         return "\n".join(lines)
 
 
+def parse_line(line: str) -> ValveScan:
+    name = line.split(" ")[1]
+    flowrate = int(re.findall(r"rate=(\d+)", line)[0])
+    downstream_names = re.findall(r"(?:valve |valves )(.+)", line)[0].split(", ")
+    return name, flowrate, tuple(downstream_names)
+
+
+def parse(data: str) -> tuple[ValveScan, ...]:
+    return tuple(parse_line(line) for line in data.splitlines())
+
+
+def part1(scan: tuple[ValveScan, ...]) -> int:
+    return Graph(scan).priority_search()
+
+
+def part2(scan: tuple[ValveScan, ...]) -> int:
+    return Graph(scan).multi_agent_search()
+
+
 if __name__ == "__main__":
-    g = Graph("day16-input")
-    print(g.priority_search())
-    print(g.multi_agent_search())
+    scan = parse(puzzle.input_data)
+    print("--- Part 1 ---")
+    print(part1(scan))
+    print("--- Part 2 ---")
+    print(part2(scan))
@@ -1,6 +1,10 @@
-from aocd.models import Puzzle  # type: ignore
 from itertools import cycle
 
+import numpy as np
+
+from grid import Grid
+from inputs import Puzzle
+
 puzzle = Puzzle(year=2022, day=17)
 
 ROCKTYPES = ("-", "+", "L", "I", "o")
@@ -93,30 +97,28 @@ class Tetris:
         self.jetcycle = cycle(enumerate(data))
         self.rockcycle = cycle(ROCKTYPES)
         self.width = 7
-        self.tower: list[set[tuple[int, int]]] = []
+        # The tower is indexed (y, x) and grows upwards as rocks come to rest.
+        self.tower = Grid.filled((64, self.width), dtype=bool)
+        self.tower_height = 0
+        self.view_cells()
+
+    def view_cells(self):
+        """Views the tower through a memoryview, much faster to index than NumPy."""
+        self.cells = memoryview(self.tower.values)
 
     def __getitem__(self, idx: int | slice):
         if isinstance(idx, int):
-            if idx >= self.tower_height:
-                return set()
-            return self.tower[idx]
+            return self.get_slice(idx, idx + 1)
         elif isinstance(idx, slice):
             start = idx.start if idx.start is not None else 0
             stop = idx.stop if idx.stop is not None else self.tower_height
-            if start >= self.tower_height:
-                return set()
-            return set.union(*self.tower[start : min(stop, self.tower_height)])
+            return self.get_slice(start, stop)
         else:
             raise TypeError(f"Expected int or slice, got type {type(idx)}")
 
     def get_slice(self, start: int, stop: int) -> set[tuple[int, int]]:
-        if start >= self.tower_height:
-            return set()
-        return set.union(*self.tower[start : min(stop, self.tower_height)])
-
-    @property
-    def tower_height(self) -> int:
-        return len(self.tower)
+        rows = self.tower.values[start : min(stop, self.tower_height)]
+        return {(int(x), start + int(y)) for y, x in np.argwhere(rows)}
 
     @property
     def spawn_point(self) -> tuple[int, int]:
@@ -130,22 +132,24 @@ class Tetris:
         return xmin < 0 or xmax > self.width
 
     def collision_check(self, rock: Rock) -> bool:
-        lb, ub = rock.ybounds
-        tower_coordinates = self.get_slice(lb, ub)
-        return not rock.coordinates.isdisjoint(tower_coordinates)
+        cells = self.cells
+        height = self.tower_height
+        return any(y < height and cells[y, x] for x, y in rock.coordinates)
 
     def stop_fall(self, rock: Rock) -> bool:
         for x, y in rock.lower_edge:
-            if y == 0 or (x, y - 1) in self[y - 1]:
+            if y == 0 or self.cells[y - 1, x]:
                 return True
         return False
 
     def add_to_tower(self, rock: Rock) -> None:
         ymin, ymax = rock.ybounds
-        while self.tower_height < ymax:
-            self.tower.append(set())
+        if ymax > self.tower.height:
+            self.tower.grow(ymax - 1, 0)
+            self.view_cells()
         for x, y in rock.coordinates:
-            self.tower[y].add((x, y))
+            self.cells[y, x] = True
+        self.tower_height = max(self.tower_height, ymax)
 
     def add_rocks(self, n: int) -> int:
         for _ in range(n):
@@ -201,41 +205,25 @@ class Tetris:
                     rock.down()
         return self.tower_height
 
+    def render(self, start: int, stop: int) -> list[str]:
+        """Renders the rows from start to stop, top row first."""
+        rows = Grid(self.tower.values[max(start, 0) : stop][::-1])
+        return ["|" + line + "|" for line in rows.render(".#").splitlines()]
+
     def head(self, n: int) -> None:
-        lines = [
-            "|"
-            + "".join(
-                ["#" if (x, y) in self.tower[y] else "." for x in range(self.width)]
-            )
-            + "|"
-            for y in range(self.tower_height - n, self.tower_height)
-        ]
-        lines.insert(0, (self.width + 2) * "~")
-        print("\n".join([line for line in lines[::-1]]))
+        lines = self.render(self.tower_height - n, self.tower_height)
+        lines.append((self.width + 2) * "~")
+        print("\n".join(lines))
 
     def __str__(self) -> str:
-        lines = [
-            "|"
-            + "".join(
-                ["#" if (x, y) in self.tower[y] else "." for x in range(self.width)]
-            )
-            + "|"
-            for y in range(self.tower_height)
-        ]
-        lines.insert(0, "+" + self.width * "-" + "+")
-        return "\n".join([line for line in lines[::-1]])
+        lines = self.render(0, self.tower_height)
+        lines.append("+" + self.width * "-" + "+")
+        return "\n".join(lines)
 
     def __repr__(self) -> str:
-        lines = [
-            "|"
-            + "".join(
-                ["#" if (x, y) in self.tower[y] else "." for x in range(self.width)]
-            )
-            + "|"
-            for y in range(self.tower_height - 8, self.tower_height)
-        ]
-        lines.insert(0, (self.width + 2) * "~")
-        return "\n".join([line for line in lines[::-1]])
+        lines = self.render(self.tower_height - 8, self.tower_height)
+        lines.append((self.width + 2) * "~")
+        return "\n".join(lines)
 
 
 def tower_height_after_n_rocks(jet_path: str, n: int) -> int:
@@ -243,23 +231,28 @@ def tower_height_after_n_rocks(jet_path: str, n: int) -> int:
     return t.add_rocks(n)
 
 
-def part1(data: str) -> str:
-    t = Tetris(data)
+def parse(data: str) -> str:
+    return data.strip()
+
+
+def part1(jets: str) -> str:
+    t = Tetris(jets)
     h1 = t.height_after_n_rocks(2022)
     return str(h1)
 
 
-def part2(data: str) -> str:
-    t = Tetris(data)
+def part2(jets: str) -> str:
+    t = Tetris(jets)
     h2 = t.height_after_n_rocks(1_000_000_000_000)
     return str(h2)
 
 
 if __name__ == "__main__":
+    jets = parse(puzzle.input_data)
     print("--- Part 1 ---")
-    h1 = part1(puzzle.input_data)
+    h1 = part1(jets)
     print("Height of tower after 2022 rocks:", h1)
 
     print("--- Part 2 ---")
-    h2 = part2(puzzle.input_data)
+    h2 = part2(jets)
     print("Height of tower after 1000000000000 rocks:", h2)
@@ -1,4 +1,4 @@
-from aocd.models import Puzzle  # type: ignore
+from inputs import Puzzle
 from typing import Iterable
 
 puzzle = Puzzle(year=2022, day=18)
@@ -6,13 +6,13 @@ puzzle = Puzzle(year=2022, day=18)
 Point = tuple[int, int, int]
 
 
-def parse_data(data: str) -> set[Point]:
+def parse(data: str) -> frozenset[Point]:
     split_lines = (line.split(",") for line in data.splitlines())
-    points = {(int(x), int(y), int(z)) for x, y, z in split_lines}
+    points = frozenset((int(x), int(y), int(z)) for x, y, z in split_lines)
     return points
 
 
-def num_exposed_faces(points: set[Point]) -> int:
+def num_exposed_faces(points: frozenset[Point]) -> int:
     n = len(points) * 6
     n_adjacent = 2 * (
         sum(int((x - 1, y, z) in points) for (x, y, z) in points)
@@ -23,7 +23,7 @@ def num_exposed_faces(points: set[Point]) -> int:
 
 
 class LavaDroplet:
-    def __init__(self, points: set[Point]) -> None:
+    def __init__(self, points: frozenset[Point]) -> None:
         self.droplet = points
         self.set_bounds(pad=1)
         self.steam: set[Point] = set()
@@ -90,21 +90,20 @@ class LavaDroplet:
         return "\n\n".join(layers)
 
 
-def part1(data: str) -> str:
-    points = parse_data(data)
+def part1(points: frozenset[Point]) -> str:
     exposed_faces = num_exposed_faces(points)
     return str(exposed_faces)
 
 
-def part2(data: str) -> str:
-    points = parse_data(data)
+def part2(points: frozenset[Point]) -> str:
     lava = LavaDroplet(points)
     exterior_faces = lava.exterior_surface()
     return str(exterior_faces)
 
 
 if __name__ == "__main__":
+    points = parse(puzzle.input_data)
     print("--- Part 1 ---")
-    print("Number of exposed faces:", part1(puzzle.input_data))
+    print("Number of exposed faces:", part1(points))
     print("--- Part 2 ---")
-    print("Number of exterior faces:", part2(puzzle.input_data))
+    print("Number of exterior faces:", part2(points))
@@ -1,4 +1,6 @@
-from aocd.models import Puzzle  # type: ignore
+import instrument
+from inputs import Puzzle
+from instrument import INFO
 from copy import deepcopy
 import re
 import math
@@ -10,6 +12,8 @@ puzzle = Puzzle(year=2022, day=19)
 ROBOT_TYPES = ("ore", "clay", "obsidian", "geode")
 ROBOT_TYPE_SHORT = {"ore": "o", "clay": "c", "obsidian": "b", "geode": "g"}
 
+Blueprint = tuple[int, dict[str, dict[str, int]]]
+
 
 class TooExpensiveError(Exception):
     pass
@@ -94,7 +98,7 @@ class RobotFactory:
         return new_factory
 
 
-def parse_blueprint(blueprint: str) -> tuple[int, dict[str, dict[str, int]]]:
+def parse_blueprint(blueprint: str) -> Blueprint:
     id_number: int = int(re.findall(r"Blueprint (\d+)", blueprint)[0])
     ore_robot_cost: dict[str, int] = {
         "ore": int(re.findall(r"Each ore robot costs (\d+)", blueprint)[0])
@@ -139,18 +143,21 @@ class GeodeOptimizer:
     def __init__(self, time_limit: int) -> None:
         self.time_limit = time_limit
         self.current_max: int = 0
+        self.count_states = instrument.enabled(INFO)
 
-    def max_geode_production(self, blueprint) -> int:
-        id_number, robot_cost = parse_blueprint(blueprint)
+    def max_geode_production(self, blueprint: Blueprint) -> int:
+        id_number, robot_cost = blueprint
         factory = RobotFactory(robot_cost)
         self.current_max = 0
         geode_production = self.max_geode_production_recur(factory, self.time_limit, "")
-        print(id_number, geode_production)
+        instrument.event(INFO, "blueprint", id=id_number, geodes=geode_production)
         return geode_production
 
     def max_geode_production_recur(
         self, factory: RobotFactory, time_left: int, build_order: str
     ) -> int:
+        if self.count_states:
+            instrument.count("day19.states")
         if time_left == 0:
             if factory.resource_pool["geode"] > self.current_max:
                 self.current_max = factory.resource_pool["geode"]
@@ -183,12 +190,12 @@ class GeodeOptimizer:
                 )
         return max(outcomes)
 
-    def quality_level(self, blueprint: str):
-        id_number, robot_cost = parse_blueprint(blueprint)
+    def quality_level(self, blueprint: Blueprint):
+        id_number, robot_cost = blueprint
         factory = RobotFactory(robot_cost)
         self.current_max = 0
         geode_production = self.max_geode_production_recur(factory, self.time_limit, "")
-        print(id_number, geode_production, id_number * geode_production)
+        instrument.event(INFO, "blueprint", id=id_number, geodes=geode_production)
         return id_number * geode_production
 
 
@@ -217,20 +224,23 @@ def test_factory(blueprint: str):
         print(factory)
 
 
-def part1(data: str) -> int:
+def parse(data: str) -> tuple[Blueprint, ...]:
+    return tuple(parse_blueprint(blueprint) for blueprint in data.splitlines())
+
+
+def part1(blueprints: tuple[Blueprint, ...]) -> int:
     g = GeodeOptimizer(24)
-    return sum(g.quality_level(blueprint) for blueprint in data.splitlines())
+    return sum(g.quality_level(blueprint) for blueprint in blueprints)
 
 
-def part2(data: str) -> int:
+def part2(blueprints: tuple[Blueprint, ...]) -> int:
     g = GeodeOptimizer(32)
-    return math.prod(
-        g.max_geode_production(blueprint) for blueprint in data.splitlines()[:3]
-    )
+    return math.prod(g.max_geode_production(blueprint) for blueprint in blueprints[:3])
 
 
 if __name__ == "__main__":
+    blueprints = parse(puzzle.input_data)
     print("--- Part 1 ---")
-    print("Sum of quality numbers:", part1(puzzle.input_data))
+    print("Sum of quality numbers:", part1(blueprints))
     print("--- Part 2 ---")
-    print("Product of first three blueprints:", part2(puzzle.input_data))
+    print("Product of first three blueprints:", part2(blueprints))
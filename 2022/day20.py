@@ -1,4 +1,4 @@
-from aocd.models import Puzzle  # type: ignore
+from inputs import Puzzle
 
 from typing import Self, Optional, Iterable
 
@@ -48,15 +48,14 @@ def link(e1: CiferElement, e2: CiferElement):
 
 
 class Decrypter:
-    def __init__(self, data: str, decryption_key: int = 1) -> None:
+    def __init__(self, numbers: Iterable[int], decryption_key: int = 1) -> None:
         self.decryption_key = decryption_key
-        self.parse_data(data)
+        self.link_numbers(numbers)
 
-    def parse_data(self, data: str) -> None:
+    def link_numbers(self, numbers: Iterable[int]) -> None:
         self.queue: list[CiferElement] = []
-        lines = data.splitlines()
-        for line in lines:
-            n = int(line) * self.decryption_key
+        for number in numbers:
+            n = number * self.decryption_key
             e = CiferElement(n)
             if e.value == 0:
                 self.zero = e
@@ -114,20 +113,25 @@ class Decrypter:
                 self.shift_element(e)
 
 
-def part1(data: str) -> str:
-    d = Decrypter(data)
+def parse(data: str) -> tuple[int, ...]:
+    return tuple(int(line) for line in data.splitlines())
+
+
+def part1(numbers: tuple[int, ...]) -> str:
+    d = Decrypter(numbers)
     d.process_queue()
     return str(sum(d.nth_after_zero(n) for n in [1000, 2000, 3000]))
 
 
-def part2(data: str) -> str:
-    d = Decrypter(data, decryption_key=811589153)
+def part2(numbers: tuple[int, ...]) -> str:
+    d = Decrypter(numbers, decryption_key=811589153)
     d.process_queue(10)
     return str(sum(d.nth_after_zero(n) for n in [1000, 2000, 3000]))
 
 
 if __name__ == "__main__":
+    numbers = parse(puzzle.input_data)
     print("--- Part 1 ---")
-    print("Sum of positions:", part1(puzzle.input_data))
+    print("Sum of positions:", part1(numbers))
     print("--- Part 2 ---")
-    print("Sum of positions:", part2(puzzle.input_data))
+    print("Sum of positions:", part2(numbers))
@@ -1,4 +1,6 @@
-from aocd.models import Puzzle  # type: ignore
+import instrument
+from inputs import Puzzle
+from instrument import DEBUG, TRACE
 
 puzzle = Puzzle(year=2022, day=21)
 
@@ -21,11 +23,11 @@ class MonkeyTroop:
     def calculate_number(self, name: str):
         if name in self.known_numbers:
             return self.known_numbers[name]
-        m1, op, m2 = self.unknown_numbers.pop(name)
+        m1, op, m2 = self.unknown_numbers[name]
         n1 = self.calculate_number(m1)
-        print(m1, n1)
         n2 = self.calculate_number(m2)
-        print(m2, n2)
+        if instrument.enabled(TRACE):
+            instrument.event(TRACE, "yell", name=name, left=n1, right=n2, op=op)
         match op:
             case "+":
                 return n1 + n2
@@ -43,7 +45,7 @@ class MonkeyTroop:
             return "x"
         if name in self.known_numbers:
             return self.known_numbers[name]
-        m1, op, m2 = self.unknown_numbers.pop(name)
+        m1, op, m2 = self.unknown_numbers[name]
         n1 = self.get_formula(m1)
         n2 = self.get_formula(m2)
         if name == "root":
@@ -101,20 +103,23 @@ def invert_formula(formula: tuple):
     return right
 
 
-def part1(data: str):
-    troop = MonkeyTroop(data)
+def parse(data: str) -> MonkeyTroop:
+    return MonkeyTroop(data)
+
+
+def part1(troop: MonkeyTroop) -> int:
     return troop.calculate_number("root")
 
 
-def part2(data: str):
-    troop = MonkeyTroop(data)
+def part2(troop: MonkeyTroop) -> int:
     formula = troop.get_formula("root")
-    print(formula)
+    instrument.event(DEBUG, "formula", formula=formula)
     return invert_formula(formula)
 
 
 if __name__ == "__main__":
-    # print("--- Part 1 ---")
-    # print("root number:", part1(puzzle.input_data))
+    troop = parse(puzzle.input_data)
+    print("--- Part 1 ---")
+    print("root number:", part1(troop))
     print("--- Part 2 ---")
-    print("humn number:", part2(puzzle.input_data))
+    print("humn number:", part2(troop))
@@ -1,72 +1,58 @@
-from aocd.models import Puzzle  # type: ignore
+import numpy as np
+
+from grid import Grid
+from inputs import Puzzle
 
 puzzle = Puzzle(year=2022, day=22)
 
 DIRECTIONS = (">", "V", "<", "^")
 
+Notes = tuple[np.ndarray, str]
+
+
+def first_tile(tiles: np.ndarray) -> list[int]:
+    """Returns the index of the first tile in each row."""
+    return tiles.argmax(axis=1).tolist()
+
+
+def last_tile(tiles: np.ndarray) -> list[int]:
+    """Returns the index of the last tile in each row."""
+    return (tiles.shape[1] - 1 - tiles[:, ::-1].argmax(axis=1)).tolist()
+
 
 class Manifold:
-    def __init__(self, data: str, cube: bool, ignore_blocks: bool = False) -> None:
+    def __init__(
+        self,
+        board: np.ndarray,
+        moves: str,
+        cube: bool,
+        ignore_blocks: bool = False,
+    ) -> None:
         self.cube = cube
         self.ignore_blocks = ignore_blocks
-        map_data, move_data = data.split("\n\n")
-        self.moves = move_data
-        self.map = map_data.splitlines()
-        self.height = len(self.map)
-        self.width = max(len(row) for row in self.map)
+        self.moves = moves
+        self.map = Grid(board)
+        self.height, self.width = self.map.shape
         self.cube_size = self.height // 4
+        # Walls are looked up through a memoryview, much faster to index than NumPy.
+        self.walls = memoryview(board == ord("#"))
         self.i: int = 0
-        self.j: int = self.map[self.i].index(".")
+        self.j: int = int(np.flatnonzero(board[self.i] == ord("."))[0])
         self.d: int = 0
         self.path: dict[tuple[int, int], int] = {(self.i, self.j): self.d}
-        self.left_edge = self.get_left_edge()
-        self.right_edge = [len(row) - 1 for row in self.map]
-        self.upper_edge = self.get_upper_edge()
-        self.lower_edge = self.get_lower_edge()
+        tiles = board != ord(" ")
+        empty = np.flatnonzero(~tiles.any(axis=0))
+        if len(empty):
+            raise ValueError(f"No edge found for column {empty[0]}.")
+        self.left_edge = first_tile(tiles)
+        self.right_edge = last_tile(tiles)
+        self.upper_edge = first_tile(tiles.T)
+        self.lower_edge = last_tile(tiles.T)
 
     @property
     def direction(self):
         return DIRECTIONS[self.d]
 
-    def get_left_edge(self):
-        left_edge = []
-        for row in self.map:
-            j = row.index(".")
-            try:
-                j = min(j, row.index("#"))
-            except ValueError:
-                pass
-            left_edge.append(j)
-        return left_edge
-
-    def get_upper_edge(self):
-        upper_edge = []
-        for j in range(self.width):
-            for i in range(self.height):
-                try:
-                    if self.map[i][j] in [".", "#"]:
-                        upper_edge.append(i)
-                        break
-                except IndexError:
-                    pass
-            else:
-                raise ValueError(f"No upper edge found for column {j}.")
-        return upper_edge
-
-    def get_lower_edge(self):
-        lower_edge = []
-        for j in range(self.width):
-            for i in reversed(range(self.height)):
-                try:
-                    if self.map[i][j] in [".", "#"]:
-                        lower_edge.append(i)
-                        break
-                except IndexError:
-                    pass
-            else:
-                raise ValueError(f"No lower edge found for column {j}.")
-        return lower_edge
-
     def turn(self, direction: str):
         if direction == "R":
             self.d = (self.d + 1) % 4
@@ -152,7 +138,7 @@ class Manifold:
         return self.true_cube_position(next_i, next_j)
 
     def is_blocked(self, i, j) -> bool:
-        return not self.ignore_blocks and self.map[i][j] == "#"
+        return not self.ignore_blocks and self.walls[i, j]
 
     def forward(self, n: int):
         for _ in range(n):
@@ -184,28 +170,37 @@ class Manifold:
         return 1000 * (self.i + 1) + 4 * (self.j + 1) + self.d
 
     def __str__(self) -> str:
-        lines = [[c for c in row] for row in self.map]
+        values = self.map.values.copy()
         for (i, j), d in self.path.items():
-            lines[i][j] = DIRECTIONS[d]
-        return "\n".join(["".join(line) for line in lines])
+            values[i, j] = ord(DIRECTIONS[d])
+        return "\n".join(line.rstrip() for line in Grid(values).render().splitlines())
+
+
+def parse(data: str) -> Notes:
+    """Returns the board as read-only character codes, with the moves."""
+    map_data, move_data = data.split("\n\n")
+    board = Grid.parse(map_data).values
+    board.flags.writeable = False
+    return board, move_data
 
 
-def part1(data: str) -> int:
-    m = Manifold(data, cube=False)
+def part1(notes: Notes) -> int:
+    m = Manifold(*notes, cube=False)
     password = m.execute_moves()
     # print(m)
     return password
 
 
-def part2(data: str) -> int:
-    m = Manifold(data, cube=True)
+def part2(notes: Notes) -> int:
+    m = Manifold(*notes, cube=True)
     password = m.execute_moves()
     # print(m)
     return password
 
 
 if __name__ == "__main__":
+    notes = parse(puzzle.input_data)
     print("--- Part 1 ---")
-    print("Password:", part1(puzzle.input_data))
+    print("Password:", part1(notes))
     print("--- Part 2 ---")
-    print("Password:", part2(puzzle.input_data))
+    print("Password:", part2(notes))
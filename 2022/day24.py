@@ -1,6 +1,9 @@
-from aocd.models import Puzzle  # type: ignore
+from inputs import Puzzle
 from math import lcm
-from typing import Iterable
+
+import numpy as np
+
+from grid import E, N, S, W, Grid
 
 puzzle = Puzzle(year=2022, day=24)
 
@@ -11,9 +14,8 @@ class Valley:
         self.height: int = len(lines) - 2
         self.width: int = len(lines[0]) - 2
         self.period: int = lcm(self.height, self.width)
-        self._values: list[list[str]] = [
-            [c for c in line[1:-1]] for line in lines[1:-1]
-        ]
+        self.grid = Grid.parse("\n".join(line[1:-1] for line in lines[1:-1]))
+        self.blizzards = {c: self.grid.values == ord(c) for c in "^v<>"}
         self.start: tuple[int, int] = (-1, 0)
         self.end: tuple[int, int] = (self.height, self.width - 1)
 
@@ -33,6 +35,14 @@ class Valley:
             return True
         return False
 
+    def blocked(self, t: int) -> np.ndarray:
+        return (
+            np.roll(self.blizzards["^"], -t, axis=0)
+            | np.roll(self.blizzards["v"], t, axis=0)
+            | np.roll(self.blizzards["<"], -t, axis=1)
+            | np.roll(self.blizzards[">"], t, axis=1)
+        )
+
     def isinbounds(self, i: int, j: int) -> bool:
         if self.isendpoint(i, j):
             return True
@@ -46,11 +56,10 @@ class Valley:
     def __getitem__(self, idx: tuple[int, int]) -> str:
         if not isinstance(idx, tuple):
             raise TypeError
-        i, j = idx
-        return self._values[i][j]
+        return chr(self.grid[idx])
 
     def __str__(self) -> str:
-        return "\n".join(["".join([c for c in line]) for line in self._values])
+        return self.grid.render()
 
 
 class FloodFill:
@@ -58,33 +67,41 @@ class FloodFill:
         self.valley = valley
         self.start: tuple[int, int] = (-1, 0)
         self.end = (valley.height, valley.width - 1)
-        self.nodes: set[tuple[int, int]] = {self.start}
         self.t: int = 0
+        self.reset(self.start)
 
-    def neighbors(self, node: tuple[int, int]) -> Iterable[tuple[int, int]]:
-        i, j = node
-        V = self.valley
-        if V.isvalid(i, j, self.t + 1):
-            yield i, j
-        if V.isvalid(i + 1, j, self.t + 1):
-            yield i + 1, j
-        if V.isvalid(i, j + 1, self.t + 1):
-            yield i, j + 1
-        if V.isvalid(i - 1, j, self.t + 1):
-            yield i - 1, j
-        if V.isvalid(i, j - 1, self.t + 1):
-            yield i, j - 1
+    def reset(self, node: tuple[int, int]) -> None:
+        self.reachable = Grid.filled(self.valley.grid.shape, dtype=bool)
+        self.at_start = node == self.start
+        self.at_end = node == self.end
+        if not (self.at_start or self.at_end):
+            self.reachable[node] = True
+
+    @property
+    def nodes(self) -> set[tuple[int, int]]:
+        nodes = set(self.reachable.coordinates())
+        if self.at_start:
+            nodes.add(self.start)
+        if self.at_end:
+            nodes.add(self.end)
+        return nodes
 
     def step(self) -> None:
-        new_nodes: set[tuple[int, int]] = set()
-        for node in self.nodes:
-            new_nodes.update(self.neighbors(node))
-        self.nodes = new_nodes
+        spread = self.reachable.values.copy()
+        for offset in (N, S, W, E):
+            spread |= self.reachable.shifted(*offset)
+        if self.at_start:
+            spread[0, 0] = True
+        if self.at_end:
+            spread[-1, -1] = True
+        self.at_start = self.at_start or bool(self.reachable.values[0, 0])
+        self.at_end = self.at_end or bool(self.reachable.values[-1, -1])
+        self.reachable.values = spread & ~self.valley.blocked(self.t + 1)
         self.t += 1
 
     @property
     def complete(self) -> bool:
-        return self.end in self.nodes
+        return self.at_end
 
     def fill(self, display: bool = False) -> int:
         while not self.complete:
@@ -95,24 +112,25 @@ class FloodFill:
         return self.t
 
     def roundtrip(self, display: bool = False) -> int:
-        while self.end not in self.nodes:
+        while not self.at_end:
             self.step()
-        self.nodes = {self.end}
-        while self.start not in self.nodes:
+        self.reset(self.end)
+        while not self.at_start:
             self.step()
-        self.nodes = {self.start}
-        while self.end not in self.nodes:
+        self.reset(self.start)
+        while not self.at_end:
             self.step()
         return self.t
 
     def __str__(self) -> str:
+        nodes = self.nodes
         lines = []
         for i in range(self.valley.height):
             line = []
             for j in range(self.valley.width):
                 if self.valley.isblocked(i, j, self.t):
                     line.append("#")
-                elif (i, j) in self.nodes:
+                elif (i, j) in nodes:
                     line.append("O")
                 else:
                     line.append(".")
@@ -120,23 +138,23 @@ class FloodFill:
         return "\n".join(lines)
 
 
-def part1(data: str) -> int:
-    valley = Valley(data)
+def parse(data: str) -> Valley:
+    return Valley(data)
+
+
+def part1(valley: Valley) -> int:
     flood = FloodFill(valley)
     return flood.fill()
 
 
-def part2(data: str) -> int:
-    valley = Valley(data)
+def part2(valley: Valley) -> int:
     flood = FloodFill(valley)
     return flood.roundtrip()
 
 
 if __name__ == "__main__":
+    valley = parse(puzzle.input_data)
     print("--- Part 1 ---")
-    print("Time to reach end:", part1(puzzle.input_data))
+    print("Time to reach end:", part1(valley))
     print("--- Part 2 ---")
-    print(
-        "Time to go to end, go back to start, then back to end:",
-        part2(puzzle.input_data),
-    )
+    print("Time to go to end, go back to start, then back to end:", part2(valley))
@@ -1,7 +1,9 @@
-from aocd.models import Puzzle  # type: ignore
+from inputs import MappedInput, Puzzle
 
 puzzle = Puzzle(year=2022, day=25)
 
+MAPPED_INPUT = True
+
 
 class SNAFU:
     value_map: dict[str, int] = {"0": 0, "1": 1, "2": 2, "-": -1, "=": -2}
@@ -34,10 +36,15 @@ class SNAFU:
         return self.value
 
 
-def part1(data: str) -> str:
-    total = sum([int(SNAFU(s)) for s in data.splitlines()])
+def parse(data: str | MappedInput) -> tuple[SNAFU, ...]:
+    return tuple(SNAFU(line.decode()) for line in MappedInput.of(data).lines())
+
+
+def part1(numbers: tuple[SNAFU, ...]) -> str:
+    total = sum([int(n) for n in numbers])
     return str(SNAFU(total))
 
 
 if __name__ == "__main__":
-    print(part1(puzzle.input_data))
+    numbers = parse(puzzle.input_data)
+    print(part1(numbers))
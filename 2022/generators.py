@@ -0,0 +1,467 @@
+"""Seeded generators of synthetic puzzle inputs of arbitrary size."""
+
+import argparse
+import json
+import random
+import string
+from typing import Callable
+
+Generator = Callable[[int, random.Random], str]
+
+GENERATORS: dict[int, Generator] = dict()
+
+
+def generator(day: int) -> Callable[[Generator], Generator]:
+    def register(f: Generator) -> Generator:
+        GENERATORS[day] = f
+        return f
+
+    return register
+
+
+def generate(day: int, size: int, seed: int = 0) -> str:
+    """Generates an input, without trailing newline like aocd's input_data."""
+    return GENERATORS[day](size, random.Random(seed))
+
+
+@generator(1)
+def calories(size: int, rng: random.Random) -> str:
+    """size elves carrying one to six items each."""
+    elves = (
+        "\n".join(str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 6)))
+        for _ in range(size)
+    )
+    return "\n\n".join(elves)
+
+
+@generator(2)
+def strategy_guide(size: int, rng: random.Random) -> str:
+    """size rounds of rock paper scissors."""
+    rounds = (f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(size))
+    return "\n".join(rounds)
+
+
+@generator(3)
+def rucksacks(size: int, rng: random.Random) -> str:
+    """size rucksacks (rounded up to whole groups of three).
+
+    Each rucksack has exactly one item type in both compartments, and each group of
+    three shares exactly one badge.
+    """
+    letters = string.ascii_letters
+    lines = []
+    for _ in range(-(-size // 3)):
+        shuffled = rng.sample(letters, len(letters))
+        badge, commons, rest = shuffled[0], shuffled[1:4], shuffled[4:]
+        for k, common in enumerate(commons):
+            pool = rest[k * 16 : (k + 1) * 16]
+            left_pool, right_pool = pool[:8], pool[8:]
+            n = rng.randint(3, 16)
+            left = [common, badge] + rng.choices(left_pool, k=n - 2)
+            right = [common] + rng.choices(right_pool, k=n - 1)
+            rng.shuffle(left)
+            rng.shuffle(right)
+            lines.append("".join(left + right))
+    return "\n".join(lines)
+
+
+@generator(4)
+def section_pairs(size: int, rng: random.Random) -> str:
+    """size pairs of section assignments."""
+
+    def assignment() -> str:
+        start = rng.randint(1, 99)
+        return f"{start}-{rng.randint(start, 99)}"
+
+    return "\n".join(f"{assignment()},{assignment()}" for _ in range(size))
+
+
+@generator(5)
+def crane_moves(size: int, rng: random.Random) -> str:
+    """Nine stacks at most eight crates high, followed by size valid moves."""
+    n_stacks, max_height = 9, 8
+    heights = [rng.randint(1, max_height) for _ in range(n_stacks)]
+    heights[rng.randrange(n_stacks)] = max_height
+    drawing = []
+    for level in reversed(range(max_height)):
+        row = [
+            f"[{rng.choice(string.ascii_uppercase)}]" if h > level else "   "
+            for h in heights
+        ]
+        drawing.append(" ".join(row).rstrip())
+    drawing.append(" ".join(f" {i + 1} " for i in range(n_stacks)).rstrip())
+
+    moves = []
+    for _ in range(size):
+        source = rng.choice([i for i, h in enumerate(heights) if h > 0])
+        target = rng.choice([i for i in range(n_stacks) if i != source])
+        n = rng.randint(1, heights[source])
+        heights[source] -= n
+        heights[target] += n
+        moves.append(f"move {n} from {source + 1} to {target + 1}")
+    return "\n".join(drawing) + "\n\n" + "\n".join(moves)
+
+
+@generator(6)
+def datastream(size: int, rng: random.Random) -> str:
+    """size characters whose only markers are in the last fourteen."""
+    noise = "".join(rng.choices("abc", k=max(0, size - 14)))
+    return noise + "".join(rng.sample(string.ascii_lowercase[3:], 14))
+
+
+@generator(7)
+def terminal_output(size: int, rng: random.Random) -> str:
+    """A depth-first traversal of a random tree of size files and directories.
+
+    Directories are stored as the negated index of their listing, files by size.
+    """
+    tree: list[list[tuple[str, int]]] = [[]]
+    for k in range(size):
+        parent = rng.randrange(len(tree))
+        if rng.random() < 0.3:
+            tree[parent].append((f"d{k}", -len(tree)))
+            tree.append([])
+        else:
+            tree[parent].append((f"f{k}.txt", rng.randint(1, 300_000)))
+
+    lines = ["$ cd /"]
+    stack: list[tuple[str, int | None]] = [("", 0)]
+    while stack:
+        name, node = stack.pop()
+        if node is None:
+            lines.append("$ cd ..")
+            continue
+        if name:
+            lines.append(f"$ cd {name}")
+            stack.append(("..", None))
+        lines.append("$ ls")
+        for child_name, value in tree[node]:
+            lines.append(f"dir {child_name}" if value < 0 else f"{value} {child_name}")
+        stack.extend(
+            (child_name, -value)
+            for child_name, value in reversed(tree[node])
+            if value < 0
+        )
+    return "\n".join(lines)
+
+
+@generator(8)
+def tree_heights(size: int, rng: random.Random) -> str:
+    """A size x size grid of tree heights."""
+    rows = ("".join(rng.choices(string.digits, k=size)) for _ in range(size))
+    return "\n".join(rows)
+
+
+@generator(9)
+def rope_motions(size: int, rng: random.Random) -> str:
+    """size head motions."""
+    motions = (f"{rng.choice('UDLR')} {rng.randint(1, 9)}" for _ in range(size))
+    return "\n".join(motions)
+
+
+@generator(10)
+def cpu_program(size: int, rng: random.Random) -> str:
+    """size noop and addx instructions."""
+    instructions = (
+        "noop" if rng.random() < 0.3 else f"addx {rng.randint(-10, 10)}"
+        for _ in range(size)
+    )
+    return "\n".join(instructions)
+
+
+@generator(11)
+def monkey_notes(size: int, rng: random.Random) -> str:
+    """size monkeys, each throwing to two other monkeys."""
+    primes = (2, 3, 5, 7, 11, 13, 17, 19, 23)
+    notes = []
+    for n in range(size):
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+        operand = "old" if rng.random() < 0.1 else str(rng.randint(1, 9))
+        others = [m for m in range(size) if m != n] or [n]
+        notes.append(
+            f"Monkey {n}:\n"
+            f"  Starting items: {items}\n"
+            f"  Operation: new = old {rng.choice('+*')} {operand}\n"
+            f"  Test: divisible by {primes[n % len(primes)]}\n"
+            f"    If true: throw to monkey {rng.choice(others)}\n"
+            f"    If false: throw to monkey {rng.choice(others)}\n"
+        )
+    return "\n".join(notes)
+
+
+@generator(12)
+def height_map(size: int, rng: random.Random) -> str:
+    """A height map size rows high, rising from west to east, with pits."""
+    height, width = size, max(2 * size, 27)
+    rows = []
+    for _ in range(height):
+        row = [
+            "a" if rng.random() < 0.1 else string.ascii_lowercase[min(25, j)]
+            for j in range(width)
+        ]
+        rows.append(row)
+    rows[rng.randrange(height)][0] = "S"
+    rows[rng.randrange(height)][-1] = "E"
+    return "\n".join("".join(row) for row in rows)
+
+
+@generator(13)
+def packet_pairs(size: int, rng: random.Random) -> str:
+    """size pairs of nested packets."""
+
+    def packet(depth: int = 0) -> list:
+        items: list = []
+        for _ in range(rng.randint(0, 5)):
+            if depth < 4 and rng.random() < 0.3:
+                items.append(packet(depth + 1))
+            else:
+                items.append(rng.randint(0, 10))
+        return items
+
+    def dumps(p: list) -> str:
+        return json.dumps(p, separators=(",", ":"))
+
+    pairs = (f"{dumps(packet())}\n{dumps(packet())}" for _ in range(size))
+    return "\n\n".join(pairs)
+
+
+@generator(14)
+def rock_paths(size: int, rng: random.Random) -> str:
+    """size rock paths of up to five points below the sand source."""
+    depth = 10 + size
+    paths = []
+    for _ in range(size):
+        x, y = rng.randint(450, 550), rng.randint(10, depth)
+        points = [f"{x},{y}"]
+        for k in range(rng.randint(1, 4)):
+            if k % 2 == 0:
+                x = min(560, max(440, x + rng.randint(-10, 10)))
+            else:
+                y = min(depth, max(10, y + rng.randint(-5, 5)))
+            points.append(f"{x},{y}")
+        paths.append(" -> ".join(points))
+    return "\n".join(paths)
+
+
+@generator(15)
+def sensor_reports(size: int, rng: random.Random) -> str:
+    """size sensors spread over the part two search space."""
+    reports = []
+    for _ in range(size):
+        sx, sy = rng.randint(0, 4_000_000), rng.randint(0, 4_000_000)
+        bx = sx + rng.randint(-500_000, 500_000)
+        by = sy + rng.randint(-500_000, 500_000)
+        reports.append(f"Sensor at x={sx}, y={sy}: closest beacon is at x={bx}, y={by}")
+    return "\n".join(reports)
+
+
+@generator(16)
+def valve_scan(size: int, rng: random.Random) -> str:
+    """size connected valves, about a quarter of which have a non-zero flow rate."""
+    names = ["AA"]
+    letters = string.ascii_uppercase
+    width = 2
+    while len(names) < size:
+        name = "".join(rng.choices(letters, k=width))
+        if name not in names:
+            names.append(name)
+        if len(names) >= 0.9 * 26**width:
+            width += 1
+    edges: list[set[int]] = [set() for _ in names]
+    for i in range(1, len(names)):
+        j = rng.randrange(i)
+        edges[i].add(j)
+        edges[j].add(i)
+    for _ in range(len(names) // 2):
+        i, j = rng.randrange(len(names)), rng.randrange(len(names))
+        if i != j:
+            edges[i].add(j)
+            edges[j].add(i)
+
+    lines = []
+    for i, name in enumerate(names):
+        rate = rng.randint(1, 25) if i > 0 and rng.random() < 0.25 else 0
+        downstream = ", ".join(names[j] for j in sorted(edges[i]))
+        if len(edges[i]) == 1:
+            tunnels = f"tunnel leads to valve {downstream}"
+        else:
+            tunnels = f"tunnels lead to valves {downstream}"
+        lines.append(f"Valve {name} has flow rate={rate}; {tunnels}")
+    return "\n".join(lines)
+
+
+@generator(17)
+def jet_pattern(size: int, rng: random.Random) -> str:
+    """size jets of hot gas."""
+    return "".join(rng.choices("<>", k=size))
+
+
+@generator(18)
+def lava_cubes(size: int, rng: random.Random) -> str:
+    """size distinct cubes packed into a box of about twice their volume.
+
+    The box is offset from the origin, where part two starts the steam.
+    """
+    side = max(3, round((2 * size) ** (1 / 3)) + 1)
+    cells = rng.sample(range(side**3), min(size, side**3))
+    cubes = (f"{c % side + 1},{c // side % side + 1},{c // side**2 + 1}" for c in cells)
+    return "\n".join(cubes)
+
+
+@generator(19)
+def blueprints(size: int, rng: random.Random) -> str:
+    """size robot factory blueprints."""
+    lines = []
+    for n in range(1, size + 1):
+        lines.append(
+            f"Blueprint {n}: "
+            f"Each ore robot costs {rng.randint(2, 4)} ore. "
+            f"Each clay robot costs {rng.randint(2, 4)} ore. "
+            f"Each obsidian robot costs {rng.randint(2, 4)} ore "
+            f"and {rng.randint(5, 20)} clay. "
+            f"Each geode robot costs {rng.randint(2, 4)} ore "
+            f"and {rng.randint(5, 20)} obsidian."
+        )
+    return "\n".join(lines)
+
+
+@generator(20)
+def encrypted_file(size: int, rng: random.Random) -> str:
+    """size numbers, exactly one of which is zero."""
+    numbers = [rng.choice((-1, 1)) * rng.randint(1, 10_000) for _ in range(size - 1)]
+    numbers.insert(rng.randint(0, len(numbers)), 0)
+    return "\n".join(str(n) for n in numbers)
+
+
+@generator(21)
+def monkey_riddle(size: int, rng: random.Random) -> str:
+    """A random expression tree of about size monkeys.
+
+    All numbers are positive, divisions are exact and humn is a leaf in the left
+    subtree of root, as in the real puzzle.
+    """
+    names: set[str] = {"root", "humn"}
+
+    def new_name() -> str:
+        while True:
+            name = "".join(rng.choices(string.ascii_lowercase, k=4))
+            if name not in names:
+                names.add(name)
+                return name
+
+    lines = []
+    stack = [("root", rng.randint(100, 10_000), max(size, 3), False)]
+    while stack:
+        name, value, budget, has_humn = stack.pop()
+        if budget < 3:
+            lines.append(f"{name}: {value}")
+            continue
+        op = rng.choice("+-*/")
+        if op == "*" and value % 2 != 0:
+            op = "+"
+        if op == "+" and value < 2:
+            op = "-"
+        match op:
+            case "+":
+                left = rng.randint(1, value - 1)
+                right = value - left
+            case "-":
+                right = rng.randint(1, 100)
+                left = value + right
+            case "*":
+                left, right = value // 2, 2
+            case _:
+                right = rng.randint(2, 4)
+                left = value * right
+        left_budget = rng.randint(1, budget - 2)
+        right_budget = budget - 1 - left_budget
+        humn_left = name == "root" or (has_humn and rng.random() < 0.5)
+        humn_right = has_humn and not humn_left
+        children = []
+        for child_value, child_budget, child_humn in (
+            (left, left_budget, humn_left),
+            (right, right_budget, humn_right),
+        ):
+            if child_humn and child_budget < 3:
+                child_name = "humn"
+            else:
+                child_name = new_name()
+            children.append((child_name, child_value, child_budget, child_humn))
+        lines.append(f"{name}: {children[0][0]} {op} {children[1][0]}")
+        stack.extend(children)
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
+@generator(22)
+def monkey_map(size: int, rng: random.Random) -> str:
+    """A cube net with faces of side size, folded like the real puzzle input."""
+    s = size
+    faces = {0: (1, 2), 1: (1,), 2: (0, 1), 3: (0,)}
+    rows = []
+    for i in range(4 * s):
+        face_columns = faces[i // s]
+        row = [" "] * (s * (max(face_columns) + 1))
+        for f in face_columns:
+            for j in range(f * s, (f + 1) * s):
+                row[j] = "#" if rng.random() < 0.1 else "."
+        if "." not in row:
+            row[face_columns[0] * s] = "."
+        rows.append("".join(row))
+
+    path = [str(rng.randint(1, 2 * s))]
+    for _ in range(10 * s):
+        path.append(rng.choice("RL"))
+        path.append(str(rng.randint(1, 2 * s)))
+    return "\n".join(rows) + "\n\n" + "".join(path)
+
+
+@generator(23)
+def elf_scan(size: int, rng: random.Random) -> str:
+    """A size x size scan with about a third of the ground covered by elves."""
+    rows = (
+        "".join("#" if rng.random() < 0.3 else "." for _ in range(size))
+        for _ in range(size)
+    )
+    return "\n".join(rows)
+
+
+@generator(24)
+def blizzard_valley(size: int, rng: random.Random) -> str:
+    """A valley size rows high and 3*size columns wide."""
+    height, width = size, 3 * size
+    lines = ["#." + "#" * width]
+    for _ in range(height):
+        row = (rng.choice("<>^v") if rng.random() < 0.25 else "." for _ in range(width))
+        lines.append("#" + "".join(row) + "#")
+    lines.append("#" * width + ".#")
+    return "\n".join(lines)
+
+
+@generator(25)
+def snafu_numbers(size: int, rng: random.Random) -> str:
+    """size SNAFU numbers."""
+    digits = "=-012"
+
+    def to_snafu(n: int) -> str:
+        value = []
+        while True:
+            n, r = divmod(n + 2, 5)
+            value.append(digits[r])
+            if n == 0:
+                return "".join(reversed(value))
+
+    return "\n".join(to_snafu(rng.randint(1, 10**12)) for _ in range(size))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("day", type=int)
+    parser.add_argument("size", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    print(generate(args.day, args.size, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Shortest path searches on graphs with integer node ids.
+
+A graph is an adjacency list: graph[u] holds the neighbours v of node u, or
+(v, weight) pairs for the weighted searches. Distances are kept in int64 arrays,
+with INF marking unreachable nodes and -1 marking nodes without a predecessor.
+"""
+
+import heapq
+from array import array
+from collections import deque
+from typing import Iterable, NamedTuple, Sequence
+
+INF = 2**62
+
+
+class ShortestPaths(NamedTuple):
+    dist: array
+    prev: array
+
+    def path(self, target: int) -> list[int]:
+        if self.dist[target] == INF:
+            raise ValueError(f"Node {target} is unreachable.")
+        path = [target]
+        while self.prev[path[-1]] != -1:
+            path.append(self.prev[path[-1]])
+        return path[::-1]
+
+
+def as_sources(sources: int | Iterable[int]) -> list[int]:
+    return [sources] if isinstance(sources, int) else list(sources)
+
+
+def bfs(graph: Sequence[Sequence[int]], sources: int | Iterable[int]) -> ShortestPaths:
+    """Breadth first search for unit weights, from one or several sources."""
+    dist = array("q", [INF]) * len(graph)
+    prev = array("q", [-1]) * len(graph)
+    queue = deque(as_sources(sources))
+    for s in queue:
+        dist[s] = 0
+    while queue:
+        u = queue.popleft()
+        d = dist[u] + 1
+        for v in graph[u]:
+            if dist[v] == INF:
+                dist[v] = d
+                prev[v] = u
+                queue.append(v)
+    return ShortestPaths(dist, prev)
+
+
+def dijkstra(
+    graph: Sequence[Sequence[tuple[int, int]]], sources: int | Iterable[int]
+) -> ShortestPaths:
+    """Dijkstra's algorithm with a binary heap, from one or several sources."""
+    dist = array("q", [INF]) * len(graph)
+    prev = array("q", [-1]) * len(graph)
+    heap = [(0, s) for s in as_sources(sources)]
+    for _, s in heap:
+        dist[s] = 0
+    heapq.heapify(heap)
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        for v, w in graph[u]:
+            if d + w < dist[v]:
+                dist[v] = d + w
+                prev[v] = u
+                heapq.heappush(heap, (d + w, v))
+    return ShortestPaths(dist, prev)
+
+
+def all_pairs_bfs(graph: Sequence[Sequence[int]]) -> list[array]:
+    """All pairs shortest distances for unit weights, with one BFS per node."""
+    return [bfs(graph, s).dist for s in range(len(graph))]
+
+
+def floyd_warshall(graph: Sequence[Sequence[tuple[int, int]]]) -> list[array]:
+    """All pairs shortest distances for weighted, possibly dense, graphs."""
+    n = len(graph)
+    dist = [array("q", [INF]) * n for _ in range(n)]
+    for u, edges in enumerate(graph):
+        dist[u][u] = 0
+        for v, w in edges:
+            dist[u][v] = min(dist[u][v], w)
+    for k in range(n):
+        dist_k = dist[k]
+        for i in range(n):
+            dist_ik = dist[i][k]
+            if dist_ik == INF:
+                continue
+            dist_i = dist[i]
+            for j in range(n):
+                if dist_ik + dist_k[j] < dist_i[j]:
+                    dist_i[j] = dist_ik + dist_k[j]
+    return dist
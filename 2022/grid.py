@@ -0,0 +1,192 @@
+"""Compact 2D grids backed by NumPy arrays.
+
+Coordinates are (i, j) = (row, column) and may be negative: the grid keeps the
+coordinate of its top-left cell as origin, and grows (with amortized doubling) when
+content needs to move past its edges.
+"""
+
+from typing import Iterator, Self
+
+import numpy as np
+
+N = (-1, 0)
+S = (1, 0)
+W = (0, -1)
+E = (0, 1)
+NW = (-1, -1)
+NE = (-1, 1)
+SW = (1, -1)
+SE = (1, 1)
+ORTHOGONAL = (N, S, W, E)
+ADJACENT = (NW, N, NE, W, E, SW, S, SE)
+
+DIGITS = {str(d): d for d in range(10)}
+
+
+def shift(values: np.ndarray, di: int, dj: int, fill: int = 0) -> np.ndarray:
+    """Returns an array with shifted[i, j] = values[i + di, j + dj]."""
+    h, w = values.shape
+    out = np.full_like(values, fill)
+    out[max(-di, 0) : h + min(-di, 0), max(-dj, 0) : w + min(-dj, 0)] = values[
+        max(di, 0) : h + min(di, 0), max(dj, 0) : w + min(dj, 0)
+    ]
+    return out
+
+
+def padding(needed: int, size: int) -> int:
+    return max(needed, size) if needed > 0 else 0
+
+
+class Grid:
+    def __init__(self, values: np.ndarray, origin: tuple[int, int] = (0, 0)) -> None:
+        self.values = values
+        self.origin = origin
+
+    @classmethod
+    def parse(
+        cls,
+        data: str,
+        mapping: dict[str, int] | None = None,
+        dtype: type | np.dtype = np.uint8,
+        fill: str = " ",
+    ) -> Self:
+        """Parses a block of text, padding short lines with fill.
+
+        Without mapping the values are the character codes, otherwise every
+        character in mapping is translated and all others become zero.
+        """
+        lines = data.splitlines()
+        width = max(len(line) for line in lines)
+        text = "".join(line.ljust(width, fill) for line in lines).encode()
+        raw = np.frombuffer(text, dtype=np.uint8).reshape(len(lines), width)
+        if mapping is None:
+            return cls(raw.astype(dtype))
+        table = np.zeros(256, dtype=dtype)
+        for c, value in mapping.items():
+            table[ord(c)] = value
+        return cls(table[raw])
+
+    @classmethod
+    def filled(
+        cls,
+        shape: tuple[int, int],
+        fill: int = 0,
+        dtype: type | np.dtype = np.uint8,
+        origin: tuple[int, int] = (0, 0),
+    ) -> Self:
+        return cls(np.full(shape, fill, dtype=dtype), origin)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.values.shape
+
+    @property
+    def height(self) -> int:
+        return self.values.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.values.shape[1]
+
+    def index(self, i: int, j: int) -> tuple[int, int]:
+        return i - self.origin[0], j - self.origin[1]
+
+    def in_bounds(self, i: int, j: int) -> bool:
+        i, j = self.index(i, j)
+        return 0 <= i < self.height and 0 <= j < self.width
+
+    def __getitem__(self, idx: tuple[int, int]):
+        return self.values[self.index(*idx)]
+
+    def __setitem__(self, idx: tuple[int, int], value) -> None:
+        self.values[self.index(*idx)] = value
+
+    def neighbors(
+        self, i: int, j: int, offsets: tuple[tuple[int, int], ...] = ORTHOGONAL
+    ) -> Iterator[tuple[int, int]]:
+        for di, dj in offsets:
+            if self.in_bounds(i + di, j + dj):
+                yield i + di, j + dj
+
+    def shifted(self, di: int, dj: int, fill: int = 0) -> np.ndarray:
+        return shift(self.values, di, dj, fill)
+
+    def neighbor_count(
+        self, offsets: tuple[tuple[int, int], ...] = ADJACENT
+    ) -> np.ndarray:
+        count = np.zeros(self.shape, dtype=np.uint8)
+        for di, dj in offsets:
+            count += self.shifted(di, dj) != 0
+        return count
+
+    def pad(self, top: int, bottom: int, left: int, right: int, fill: int = 0) -> None:
+        self.values = np.pad(
+            self.values, ((top, bottom), (left, right)), constant_values=fill
+        )
+        self.origin = (self.origin[0] - top, self.origin[1] - left)
+
+    def grow(self, i: int, j: int, fill: int = 0) -> None:
+        """Grows the grid so that (i, j) is in bounds, at least doubling the side."""
+        if self.in_bounds(i, j):
+            return
+        i, j = self.index(i, j)
+        h, w = self.shape
+        self.pad(
+            padding(-i, h),
+            padding(i - h + 1, h),
+            padding(-j, w),
+            padding(j - w + 1, w),
+            fill,
+        )
+
+    def ensure_margin(self, margin: int = 1) -> None:
+        """Grows the grid until no non-zero cell is within margin of an edge."""
+        rows = np.flatnonzero(self.values.any(axis=1))
+        cols = np.flatnonzero(self.values.any(axis=0))
+        if len(rows) == 0:
+            return
+        h, w = self.shape
+        top = h if rows[0] < margin else 0
+        bottom = h if rows[-1] >= h - margin else 0
+        left = w if cols[0] < margin else 0
+        right = w if cols[-1] >= w - margin else 0
+        if top or bottom or left or right:
+            self.pad(top, bottom, left, right)
+
+    def bounds(self) -> tuple[int, int, int, int]:
+        """Returns imin, imax, jmin, jmax of the non-zero cells, inclusive."""
+        rows = np.flatnonzero(self.values.any(axis=1))
+        cols = np.flatnonzero(self.values.any(axis=0))
+        oi, oj = self.origin
+        return (
+            oi + int(rows[0]),
+            oi + int(rows[-1]),
+            oj + int(cols[0]),
+            oj + int(cols[-1]),
+        )
+
+    def crop(self, margin: int = 0) -> Self:
+        imin, imax, jmin, jmax = self.bounds()
+        i0, j0 = self.index(imin - margin, jmin - margin)
+        i1, j1 = self.index(imax + margin + 1, jmax + margin + 1)
+        h, w = self.shape
+        values = self.values[max(i0, 0) : min(i1, h), max(j0, 0) : min(j1, w)]
+        origin = (self.origin[0] + max(i0, 0), self.origin[1] + max(j0, 0))
+        return type(self)(values, origin)
+
+    def coordinates(self) -> Iterator[tuple[int, int]]:
+        oi, oj = self.origin
+        for i, j in np.argwhere(self.values):
+            yield oi + int(i), oj + int(j)
+
+    def render(self, chars: str | None = None) -> str:
+        """Renders the grid as text, mapping value v to chars[v] if chars is given."""
+        if chars is None:
+            table = np.arange(256, dtype=np.uint8)
+        else:
+            table = np.frombuffer(chars.encode(), dtype=np.uint8)
+        text = table[self.values.astype(np.intp)]
+        return "\n".join(row.tobytes().decode() for row in text)
+
+    def __str__(self) -> str:
+        return self.render(".#" if self.values.dtype == bool else None)
@@ -0,0 +1,277 @@
+"""Offline, content-addressed cache of puzzle inputs.
+
+Inputs are stored as objects/<sha256> files with a refs/<year>/<day> file pointing at
+the object. The cache is filled from plain input files next to the solutions, and
+only falls back to aocd (and the network) when neither is available.
+
+Large inputs can be read through MappedInput, which memory-maps the object and
+iterates over it as bytes, without decoding it or splitting it into a list of lines.
+Numbers can also be parsed with NumPy straight from the mapping, a chunk at a time.
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import re
+from functools import cached_property
+from typing import Iterator, Self
+
+import numpy as np
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.environ.get("AOC_INPUT_CACHE", os.path.join(DIRECTORY, ".inputs"))
+OFFLINE = bool(os.environ.get("AOC_OFFLINE"))
+
+
+class InputNotFoundError(FileNotFoundError):
+    pass
+
+
+def object_path(digest: str) -> str:
+    return os.path.join(CACHE_DIR, "objects", digest)
+
+
+def ref_path(year: int, day: int) -> str:
+    return os.path.join(CACHE_DIR, "refs", str(year), f"{day:02d}")
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def store(year: int, day: int, data: bytes) -> str:
+    digest = hashlib.sha256(data).hexdigest()
+    if not os.path.exists(object_path(digest)):
+        write_atomic(object_path(digest), data)
+    write_atomic(ref_path(year, day), digest.encode())
+    return digest
+
+
+def import_file(year: int, day: int, path: str) -> str:
+    with open(path, "rb") as f:
+        return store(year, day, f.read())
+
+
+def lookup(year: int, day: int) -> str | None:
+    try:
+        with open(ref_path(year, day)) as f:
+            digest = f.read().strip()
+    except FileNotFoundError:
+        return None
+    if not os.path.exists(object_path(digest)):
+        return None
+    return digest
+
+
+class MappedInput:
+    """Read-only bytes view of an input, memory-mapped when read from a file."""
+
+    INT = re.compile(rb"-?\d+")
+    UINT = re.compile(rb"\d+")
+
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:
+        self.buffer = buffer
+
+    @classmethod
+    def open(cls, path: str) -> Self:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return cls(b"")
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @classmethod
+    def of(cls, data: "str | MappedInput") -> "MappedInput":
+        """Wraps a decoded input, so that parsers can accept either kind."""
+        if isinstance(data, MappedInput):
+            return data
+        return cls(data.encode())
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def lines(self) -> Iterator[bytes]:
+        """Yields the lines without their terminator, ignoring a final newline."""
+        buffer = self.buffer
+        end = len(buffer)
+        while end > 0 and buffer[end - 1 : end] in (b"\n", b"\r"):
+            end -= 1
+        start = 0
+        while start < end:
+            stop = buffer.find(b"\n", start, end)
+            if stop == -1:
+                stop = end
+            line_end = stop - 1 if buffer[stop - 1 : stop] == b"\r" else stop
+            yield buffer[start:line_end]
+            start = stop + 1
+
+    def view(self) -> memoryview:
+        """Returns a view of the buffer without surrounding whitespace, copying none."""
+        buffer = self.buffer
+        start, end = 0, len(buffer)
+        while start < end and buffer[start : start + 1].isspace():
+            start += 1
+        while end > start and buffer[end - 1 : end].isspace():
+            end -= 1
+        return memoryview(buffer)[start:end]
+
+    def array(self) -> np.ndarray:
+        """Returns the buffer as a uint8 array sharing its memory."""
+        return np.frombuffer(self.buffer, dtype=np.uint8)
+
+    def chunks(
+        self, size: int, separators: tuple[bytes, ...] = (b"\n",)
+    ) -> Iterator[tuple[int, int]]:
+        """Yields (start, stop) offsets of consecutive chunks of about size bytes.
+
+        Each chunk but the last ends just after the first byte of a separator, so that
+        a chunk cut after a newline only holds whole lines.
+        """
+        buffer = self.buffer
+        start = 0
+        while start < len(buffer):
+            stop = len(buffer)
+            # Search size bytes at a time, so that a rare separator is not looked for
+            # through the whole rest of the input for every chunk.
+            position = start + size
+            while position < len(buffer):
+                end = position + size
+                found = [
+                    buffer.find(sep, position, end + len(sep) - 1) for sep in separators
+                ]
+                found = [i for i in found if i != -1]
+                if found:
+                    stop = min(found) + 1
+                    break
+                position = end
+            yield start, stop
+            start = stop
+
+    def ints(self, signed: bool = True) -> Iterator[int]:
+        """Yields every integer field in order, skipping all other bytes."""
+        pattern = self.INT if signed else self.UINT
+        for match in pattern.finditer(self.buffer):
+            yield int(match[0])
+
+    def close(self) -> None:
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+    def __repr__(self) -> str:
+        return f"MappedInput({len(self)} bytes)"
+
+
+def uint_fields(view: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Parses the unsigned integers of a uint8 array, with the offsets they start at.
+
+    The numbers are built one digit position at a time, so the work is vectorized
+    over all numbers and only loops over the length of the longest.
+    """
+    digits = view - ord("0")
+    is_digit = (digits < 10).view(np.int8)
+    edges = np.diff(is_digit, prepend=np.int8(0), append=np.int8(0))
+    starts = np.flatnonzero(edges == 1)
+    lengths = np.flatnonzero(edges == -1) - starts
+    values = np.zeros(len(starts), dtype=np.int64)
+    for k in range(lengths.max(initial=0)):
+        active = np.flatnonzero(lengths > k)
+        values[active] = values[active] * 10 + digits[starts[active] + k]
+    return values, starts
+
+
+def read_object(digest: str) -> str:
+    with open(object_path(digest), "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            return str(m, "utf-8")
+
+
+def local_input_files(day: int) -> list[str]:
+    names = [f"day{day:02d}-input", f"day-{day:02d}-input"]
+    return [os.path.join(DIRECTORY, name) for name in names]
+
+
+def fetch(year: int, day: int) -> str:
+    if OFFLINE:
+        raise InputNotFoundError(f"No cached input for {year} day {day} (offline).")
+    from aocd.models import Puzzle as AocdPuzzle  # type: ignore
+
+    return AocdPuzzle(year=year, day=day).input_data
+
+
+def resolve(year: int, day: int) -> str:
+    """Returns the digest of an input, importing or fetching it if needed."""
+    digest = lookup(year, day)
+    if digest is None:
+        for path in local_input_files(day):
+            if os.path.exists(path):
+                digest = import_file(year, day, path)
+                break
+        else:
+            digest = store(year, day, fetch(year, day).encode())
+    return digest
+
+
+def load(year: int, day: int) -> str:
+    return read_object(resolve(year, day))
+
+
+class Puzzle:
+    """Drop-in for aocd's Puzzle that does nothing until the input is accessed."""
+
+    def __init__(self, year: int, day: int) -> None:
+        self.year = year
+        self.day = day
+
+    @cached_property
+    def input_data(self) -> str:
+        return load(self.year, self.day).rstrip("\r\n")
+
+    @cached_property
+    def mapped_input(self) -> MappedInput:
+        return MappedInput.open(object_path(resolve(self.year, self.day)))
+
+    @cached_property
+    def examples(self) -> list:
+        from aocd.models import Puzzle as AocdPuzzle  # type: ignore
+
+        return AocdPuzzle(year=self.year, day=self.day).examples
+
+    def __repr__(self) -> str:
+        return f"Puzzle(year={self.year}, day={self.day})"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Fill the puzzle input cache.")
+    parser.add_argument("--year", type=int, default=2022)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    import_parser = subparsers.add_parser("import", help="import a plain input file")
+    import_parser.add_argument("day", type=int)
+    import_parser.add_argument("path")
+    subparsers.add_parser("import-all", help="import all dayNN-input files")
+    fetch_parser = subparsers.add_parser("fetch", help="download an input with aocd")
+    fetch_parser.add_argument("day", type=int)
+    args = parser.parse_args(argv)
+
+    if args.command == "import":
+        digest = import_file(args.year, args.day, args.path)
+        print(f"{args.year} day {args.day:>2}: {digest}")
+    elif args.command == "import-all":
+        for day in range(1, 26):
+            for path in local_input_files(day):
+                if os.path.exists(path):
+                    digest = import_file(args.year, day, path)
+                    print(f"{args.year} day {day:>2}: {digest}")
+                    break
+    elif args.command == "fetch":
+        digest = store(args.year, args.day, fetch(args.year, args.day).encode())
+        print(f"{args.year} day {args.day:>2}: {digest}")
+
+
+if __name__ == "__main__":
+    main()
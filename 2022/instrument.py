@@ -0,0 +1,59 @@
+"""Levelled tracing and counters for solver internals.
+
+Events are written as JSON lines to stderr when their level is enabled, which is
+set with the AOC_TRACE environment variable (trace, debug, info or off) or
+set_level. Hot loops should look up enabled() once and guard each event with it, so
+that a disabled trace costs a single branch per iteration. Counters are collected at
+the info level and emitted by report, which the runner and the profiler call after
+each part.
+"""
+
+import json
+import os
+import sys
+from collections import Counter
+from typing import Any, TextIO
+
+TRACE = 5
+DEBUG = 10
+INFO = 20
+OFF = 100
+LEVELS = {"trace": TRACE, "debug": DEBUG, "info": INFO, "off": OFF}
+
+level: int = OFF
+stream: TextIO = sys.stderr
+counters: Counter[str] = Counter()
+
+
+def set_level(new_level: int | str) -> None:
+    global level
+    if isinstance(new_level, str):
+        new_level = (
+            LEVELS[new_level.lower()] if not new_level.isdigit() else int(new_level)
+        )
+    level = new_level
+
+
+def enabled(event_level: int) -> bool:
+    return event_level >= level
+
+
+def event(event_level: int, name: str, **fields: Any) -> None:
+    if event_level < level:
+        return
+    stream.write(json.dumps({"event": name, **fields}, default=str) + "\n")
+
+
+def count(name: str, n: int = 1) -> None:
+    if enabled(INFO):
+        counters[name] += n
+
+
+def report(**fields: Any) -> None:
+    """Emits the counters as an info event, if any were counted, and resets them."""
+    if counters:
+        event(INFO, "counters", **fields, **dict(sorted(counters.items())))
+        counters.clear()
+
+
+set_level(os.environ.get("AOC_TRACE", "off"))
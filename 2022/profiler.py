@@ -0,0 +1,212 @@
+"""Profiles one part of one day with cProfile, tracemalloc and a stack sampler.
+
+Usage: python profiler.py day17.part1 [--top N] [--collapsed] [--pyinstrument]
+
+The part is profiled on its parsed input; day17.parse profiles the parse stage.
+
+The cProfile statistics are saved as profiles/dayNN-partK.pstats, or with
+--pyinstrument the sampling profiler's report as dayNN-partK-pyinstrument.txt.
+The allocations live at peak memory are reported in dayNN-partK-alloc.txt and, with
+--collapsed, the sampled stacks are written to dayNN-partK.folded, which
+flamegraph.pl and speedscope can read.
+"""
+
+import argparse
+import cProfile
+import importlib
+import io
+import os
+import pstats
+import re
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from typing import Any, Callable
+
+import instrument
+from runner import DIRECTORY, PARTS, load_input, module_name, parse_stage
+
+PROFILE_DIR = os.path.join(DIRECTORY, "profiles")
+
+
+class StackSampler:
+    def __init__(self, interval: float = 0.001) -> None:
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(stack))] += 1
+
+    def __enter__(self) -> "StackSampler":
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(self.interval)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    def collapsed(self) -> str:
+        return "\n".join(f"{stack} {n}" for stack, n in self.stacks.most_common())
+
+
+def parse_target(target: str) -> tuple[int, int]:
+    """Returns (day, part), with part 0 standing for the parse stage."""
+    match = re.fullmatch(r"(?:day)?(\d+)\.(?:part)?([12]|parse)", target)
+    if match is None:
+        raise argparse.ArgumentTypeError(f"Expected dayNN.partK, got {target}")
+    return int(match[1]), 0 if match[2] == "parse" else int(match[2])
+
+
+def run_cprofile(solve: Callable[[Any], Any], data: Any, path: str, top: int) -> str:
+    profile = cProfile.Profile()
+    profile.runcall(solve, data)
+    profile.dump_stats(path)
+    report = io.StringIO()
+    stats = pstats.Stats(profile, stream=report)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return report.getvalue()
+
+
+def run_pyinstrument(solve: Callable[[Any], Any], data: Any) -> str:
+    from pyinstrument import Profiler  # type: ignore
+
+    profiler = Profiler()
+    profiler.start()
+    try:
+        solve(data)
+    finally:
+        profiler.stop()
+    return profiler.output_text()
+
+
+class PeakSnapshotter:
+    """Keeps a tracemalloc snapshot from close to the peak of traced memory."""
+
+    def __init__(self, interval: float = 0.01, growth: float = 1.1) -> None:
+        self.interval = interval
+        self.growth = growth
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.snapshot_size = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._poll, daemon=True)
+
+    def _poll(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def check(self) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.snapshot_size * self.growth:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = current
+
+    def __enter__(self) -> "PeakSnapshotter":
+        tracemalloc.start()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+
+def run_tracemalloc(solve: Callable[[Any], Any], data: Any, top: int) -> str:
+    with PeakSnapshotter() as snapshotter:
+        result = solve(data)
+        snapshotter.check()
+    del result
+    lines = [
+        f"Peak traced memory: {snapshotter.peak / 2**20:.1f} MiB",
+        f"Top {top} allocations at {snapshotter.snapshot_size / 2**20:.1f} MiB:",
+    ]
+    if snapshotter.snapshot is not None:
+        snapshot = snapshotter.snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, threading.__file__),
+                tracemalloc.Filter(False, __file__),
+            ]
+        )
+        lines.extend(str(stat) for stat in snapshot.statistics("lineno")[:top])
+    return "\n".join(lines) + "\n"
+
+
+def run_sampler(solve: Callable[[Any], Any], data: Any, interval: float) -> str:
+    with StackSampler(interval) as sampler:
+        solve(data)
+    return sampler.collapsed() + "\n"
+
+
+def profile_part(
+    day: int,
+    part: int,
+    top: int = 20,
+    collapsed: bool = False,
+    interval: float = 0.001,
+    sampling: bool = False,
+) -> None:
+    module = importlib.import_module(module_name(day))
+    data = load_input(day, module)
+    if part == 0:
+        solve = parse_stage(module)
+        prefix = os.path.join(PROFILE_DIR, f"{module_name(day)}-parse")
+    else:
+        solve = getattr(module, PARTS[part - 1])
+        data = parse_stage(module)(data)
+        prefix = os.path.join(PROFILE_DIR, f"{module_name(day)}-part{part}")
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+
+    if sampling:
+        report = run_pyinstrument(solve, data)
+        with open(f"{prefix}-pyinstrument.txt", "w") as f:
+            f.write(report)
+    else:
+        report = run_cprofile(solve, data, f"{prefix}.pstats", top)
+    instrument.report(day=day, part=part)
+    print(report)
+    allocations = run_tracemalloc(solve, data, top)
+    with open(f"{prefix}-alloc.txt", "w") as f:
+        f.write(allocations)
+    print(allocations)
+    if collapsed:
+        with open(f"{prefix}.folded", "w") as f:
+            f.write(run_sampler(solve, data, interval))
+    print(f"Profiles written to {prefix}.*")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "target", type=parse_target, help="e.g. day17.part1, 17.1 or day17.parse"
+    )
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument(
+        "--collapsed", action="store_true", help="also write sampled stacks"
+    )
+    parser.add_argument("--interval", type=float, default=0.001)
+    parser.add_argument(
+        "--pyinstrument", action="store_true", help="profile with pyinstrument"
+    )
+    args = parser.parse_args(argv)
+    day, part = args.target
+    profile_part(day, part, args.top, args.collapsed, args.interval, args.pyinstrument)
+
+
+if __name__ == "__main__":
+    main()
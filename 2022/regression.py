@@ -0,0 +1,181 @@
+"""Checks every part against known-good answers and timings.
+
+Usage: python regression.py [days...] [--record] [--factor F] [--min-delta S]
+
+Expected answers are kept in expected.json, for the examples of each puzzle (as
+parsed by aocd) and for each real input, which is identified by its sha256. A part
+on a real input is timed as the fastest of several runs after a warm-up. The check
+fails on a wrong answer, or when that time is more than factor times the recorded
+one and also more than min-delta seconds over it. With --record the current answers
+and timings are stored instead; example answers given by aocd are preferred over the
+solver's own.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from functools import cache
+from typing import Any, Callable
+
+from bench import MIN_DELTA, is_regression, time_runs
+from cache import input_hash
+from inputs import Puzzle
+from runner import DIRECTORY, YEAR, discover_parts, load_input, module_name, solver
+
+EXPECTED_PATH = os.path.join(DIRECTORY, "expected.json")
+
+
+@dataclass
+class Expected:
+    examples: list[str | None] = field(default_factory=list)
+    inputs: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+def read_expected(path: str = EXPECTED_PATH) -> dict[str, Expected]:
+    if not os.path.exists(path):
+        return dict()
+    with open(path) as f:
+        return {key: Expected(**value) for key, value in json.load(f).items()}
+
+
+def write_expected(expected: dict[str, Expected], path: str = EXPECTED_PATH) -> None:
+    with open(path, "w") as f:
+        json.dump(
+            {key: asdict(value) for key, value in expected.items()},
+            f,
+            indent=2,
+            sort_keys=True,
+        )
+
+
+@cache
+def examples(day: int) -> list:
+    """Returns aocd's examples, or none when they cannot be loaded."""
+    module = importlib.import_module(module_name(day))
+    puzzle = getattr(module, "puzzle", None) or Puzzle(year=YEAR, day=day)
+    try:
+        return list(puzzle.examples)
+    except Exception as e:
+        print(f"Day {day:>2}: no examples ({e!r})")
+        return []
+
+
+def timed(solve: Callable[[Any], Any], data: Any) -> tuple[str, float]:
+    start = time.perf_counter()
+    answer = solve(data)
+    return str(answer), time.perf_counter() - start
+
+
+def check_part(
+    day: int,
+    part: int,
+    expected: Expected,
+    factor: float,
+    record: bool,
+    warmup: int = 1,
+    repeat: int = 5,
+    min_delta: float = MIN_DELTA,
+) -> list[str]:
+    """Solves the examples and the real input of one part.
+
+    Returns the failures, or updates expected in place when recording.
+    """
+    module = importlib.import_module(module_name(day))
+    solve = solver(module, part)
+    label = f"Day {day:>2} part {part}"
+    failures = []
+
+    recorded = []
+    for i, example in enumerate(examples(day)):
+        known = example.answer_a if part == 1 else example.answer_b
+        if example.extra:
+            # The example is solved with different parameters than the real input.
+            recorded.append(None)
+            continue
+        answer, _ = timed(solve, example.input_data)
+        recorded.append(known if known is not None else answer)
+        if record:
+            reference = known
+        elif i < len(expected.examples):
+            reference = expected.examples[i]
+        else:
+            reference = None
+        if reference is not None and answer != reference:
+            failures.append(f"{label}: example {i + 1} gave {answer}, not {reference}")
+    if record and recorded:
+        expected.examples = recorded
+
+    data = load_input(day, module)
+    digest = input_hash(data)
+    answer, _ = timed(solve, data)
+    seconds = min(time_runs(solve, data, warmup, repeat))
+    print(f"{label}: {seconds:9.3f}s  {answer}")
+    if record:
+        expected.inputs[digest] = {"answer": answer, "seconds": seconds}
+        return failures
+    reference = expected.inputs.get(digest)
+    if reference is None:
+        return failures
+    if answer != reference["answer"]:
+        failures.append(f"{label}: gave {answer}, not {reference['answer']}")
+    if is_regression(seconds, reference["seconds"], factor - 1, min_delta):
+        failures.append(
+            f"{label}: took {seconds:.3f}s, {seconds / reference['seconds']:.1f}x "
+            f"the recorded {reference['seconds']:.3f}s"
+        )
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default all)")
+    parser.add_argument("--expected", default=EXPECTED_PATH)
+    parser.add_argument(
+        "--record", action="store_true", help="store the current answers and timings"
+    )
+    parser.add_argument(
+        "--factor", type=float, default=2.0, help="allowed slowdown factor"
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=MIN_DELTA,
+        help="slowdown in seconds below which a part never fails",
+    )
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    expected = read_expected(args.expected)
+    failures = []
+    for day, part in discover_parts(args.days):
+        key = f"{day}.{part}"
+        entry = expected.setdefault(key, Expected())
+        try:
+            failures.extend(
+                check_part(
+                    day,
+                    part,
+                    entry,
+                    args.factor,
+                    args.record,
+                    args.warmup,
+                    args.repeat,
+                    args.min_delta,
+                )
+            )
+        except Exception as e:
+            failures.append(f"Day {day:>2} part {part}: failed with {e!r}")
+    if args.record:
+        write_expected(expected, args.expected)
+    for failure in failures:
+        print(failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
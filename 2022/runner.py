@@ -0,0 +1,257 @@
+"""Runs the solutions of every day in parallel and reports answers and timings."""
+
+import argparse
+import ast
+import glob
+import importlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import cache
+import instrument
+from inputs import MappedInput, Puzzle
+
+YEAR = 2022
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+TIMINGS_PATH = os.path.join(DIRECTORY, ".timings.json")
+PARTS = ("part1", "part2")
+
+
+@dataclass
+class PartResult:
+    day: int
+    part: int
+    answer: str
+    seconds: float
+    cached: bool = False
+    parse_seconds: float = 0.0
+
+    @property
+    def key(self) -> str:
+        return f"{self.day}.{self.part}"
+
+
+def module_name(day: int) -> str:
+    return f"day{day:02d}"
+
+
+def defined_parts(path: str) -> list[int]:
+    with open(path) as f:
+        tree = ast.parse(f.read(), filename=path)
+    functions = {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
+    return [i + 1 for i, part in enumerate(PARTS) if part in functions]
+
+
+def discover_parts(days: list[int] | None = None) -> list[tuple[int, int]]:
+    """Finds the (day, part) pairs with a top-level part function.
+
+    The modules are inspected without being imported, so that listing the parts
+    stays cheap.
+    """
+    tasks = []
+    for path in sorted(glob.glob(os.path.join(DIRECTORY, "day*.py"))):
+        day = int(os.path.basename(path).removeprefix("day").removesuffix(".py"))
+        if days and day not in days:
+            continue
+        tasks.extend((day, part) for part in defined_parts(path))
+    return tasks
+
+
+def load_input(day: int, module) -> str | MappedInput:
+    """Returns the day's input, memory-mapped if the module sets MAPPED_INPUT."""
+    puzzle = getattr(module, "puzzle", None) or Puzzle(year=YEAR, day=day)
+    if getattr(module, "MAPPED_INPUT", False):
+        return puzzle.mapped_input
+    return puzzle.input_data
+
+
+def identity(data: str) -> str:
+    return data
+
+
+def parse_stage(module) -> Callable[[str], Any]:
+    """Returns the day's parse stage, or the identity for days without one."""
+    return getattr(module, "parse", identity)
+
+
+def solver(module, part: int) -> Callable[[str], Any]:
+    """Returns a function solving one part from the raw input, parse included."""
+    parse = parse_stage(module)
+    solve = getattr(module, PARTS[part - 1])
+    return lambda data: solve(parse(data))
+
+
+def run_day(day: int, parts: list[int]) -> tuple[list[PartResult], list[str]]:
+    """Parses the input of a day once and solves the given parts on it.
+
+    Runs in a worker process, so that the days are parsed in parallel and the parsed
+    input is shared by the parts without being pickled. Returns the results and the
+    failures of the parts.
+    """
+    module = importlib.import_module(module_name(day))
+    start = time.perf_counter()
+    parsed = parse_stage(module)(load_input(day, module))
+    parse_seconds = time.perf_counter() - start
+    results, failures = [], []
+    for part in parts:
+        solve = getattr(module, PARTS[part - 1])
+        start = time.perf_counter()
+        try:
+            answer = solve(parsed)
+        except Exception as e:
+            failures.append(f"Day {day:>2} part {part}: failed with {e!r}")
+            continue
+        seconds = time.perf_counter() - start
+        instrument.report(day=day, part=part)
+        results.append(
+            PartResult(day, part, str(answer), seconds, False, parse_seconds)
+        )
+    return results, failures
+
+
+def worker_context() -> multiprocessing.context.BaseContext | None:
+    """Returns a fork context where forking is safe, otherwise None."""
+    if "fork" in multiprocessing.get_all_start_methods() and sys.platform != "darwin":
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def load_timings(path: str = TIMINGS_PATH) -> dict[str, float]:
+    if not os.path.exists(path):
+        return dict()
+    with open(path) as f:
+        return json.load(f)
+
+
+def parse_key(day: int) -> str:
+    return f"{day}.parse"
+
+
+def save_timings(results: list[PartResult], path: str = TIMINGS_PATH) -> None:
+    timings = load_timings(path)
+    for r in results:
+        if not r.cached:
+            timings[r.key] = r.seconds
+            timings[parse_key(r.day)] = r.parse_seconds
+    with open(path, "w") as f:
+        json.dump(timings, f, indent=2, sort_keys=True)
+
+
+def schedule(
+    days: dict[int, list[int]], timings: dict[str, float]
+) -> list[tuple[int, list[int]]]:
+    """Orders the days longest first, counting the parse and the given parts.
+
+    Parts without a timing are assumed slow.
+    """
+
+    def estimate(day: int) -> float:
+        parts = sum(timings.get(f"{day}.{part}", float("inf")) for part in days[day])
+        return timings.get(parse_key(day), 0.0) + parts
+
+    return sorted(days.items(), key=lambda item: estimate(item[0]), reverse=True)
+
+
+def print_result(result: PartResult) -> None:
+    note = "  (cached)" if result.cached else ""
+    print(
+        f"Day {result.day:>2} part {result.part}: {result.seconds:9.3f}s  "
+        f"{result.answer}{note}"
+    )
+
+
+def run_all(
+    tasks: list[tuple[int, int]],
+    workers: int | None = None,
+    use_cache: bool = not cache.BYPASS,
+):
+    """Solves the tasks in parallel, one worker task per day.
+
+    Each worker parses the input of its day once for all of the day's pending parts.
+    """
+    results: list[PartResult] = []
+    keys: dict[int, tuple[str, str] | None] = dict()
+    pending: dict[int, list[int]] = dict()
+    for day, part in tasks:
+        if day not in keys:
+            try:
+                module = importlib.import_module(module_name(day))
+                data = load_input(day, module)
+                keys[day] = cache.input_hash(data), cache.source_hash(module.__file__)
+            except Exception as e:
+                print(f"Day {day:>2}: loading failed with {e!r}")
+                keys[day] = None
+        if keys[day] is None:
+            continue
+        entry = cache.get(day, part, *keys[day]) if use_cache else None
+        if entry is not None:
+            result = PartResult(day, part, entry.answer, entry.seconds, cached=True)
+            print_result(result)
+            results.append(result)
+        else:
+            pending.setdefault(day, []).append(part)
+
+    context = worker_context()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = {
+            executor.submit(run_day, day, parts): day
+            for day, parts in schedule(pending, load_timings())
+        }
+        for future in as_completed(futures):
+            day = futures[future]
+            try:
+                solved, failures = future.result()
+            except Exception as e:
+                print(f"Day {day:>2}: parse failed with {e!r}")
+                continue
+            for result in solved:
+                if use_cache:
+                    cache.put(
+                        cache.Entry(
+                            day, result.part, *keys[day], result.answer, result.seconds
+                        )
+                    )
+                print_result(result)
+                results.append(result)
+            for failure in failures:
+                print(failure)
+    return sorted(results, key=lambda r: (r.day, r.part))
+
+
+def print_summary(results: list[PartResult], wall_time: float) -> None:
+    print()
+    print(f"{'Day':>3} {'Part':>4} {'Parse (s)':>10} {'Time (s)':>10}  Answer")
+    for r in results:
+        print(
+            f"{r.day:>3} {r.part:>4} {r.parse_seconds:>10.3f} {r.seconds:>10.3f}  "
+            f"{r.answer}"
+        )
+    cpu_time = sum(r.seconds for r in results if not r.cached)
+    print(f"Total solve time: {cpu_time:.3f}s, wall time: {wall_time:.3f}s")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default all)")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    parser.add_argument(
+        "--no-cache", action="store_true", help="recompute cached answers"
+    )
+    args = parser.parse_args(argv)
+
+    tasks = discover_parts(args.days)
+    start = time.perf_counter()
+    results = run_all(tasks, args.workers, not (args.no_cache or cache.BYPASS))
+    wall_time = time.perf_counter() - start
+    save_timings(results)
+    print_summary(results, wall_time)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,43 @@
-"""Generates a new template file for the next days challenge."""
+"""Generates a new template file for the next days challenge.
+
+The template splits parsing from solving, so that the runner, bench.py and
+profiler.py can time the two apart and both parts reuse the parsed input. Running the
+new module goes through the runner, which picks it up by its dayNN.py name.
+"""
 
 import os
 import glob
 
 year = os.getcwd().split("/")[-1]
 max_day = max(
-    int(day.removeprefix("day").removesuffix(".py")) for day in glob.glob("day*.py")
+    (int(day.removeprefix("day").removesuffix(".py")) for day in glob.glob("day*.py")),
+    default=0,
 )
-file_template = f"""from aocd.models import Puzzle # type: ignore
+day = max_day + 1
+file_template = f"""from inputs import Puzzle
+
+puzzle = Puzzle(year={year}, day={day})
+
+Parsed = list[str]
+
+
+def parse(data: str) -> Parsed:
+    return data.splitlines()
+
+
+def part1(parsed: Parsed) -> int:
+    raise NotImplementedError
 
-puzzle = Puzzle(year={year}, day={max_day+1})
 
+def part2(parsed: Parsed) -> int:
+    raise NotImplementedError
 
-def part1(data: str) -> str:
-    pass
 
-def part2(data: str) -> str:
-    pass
+if __name__ == "__main__":
+    import runner
 
-if __name__ == \"__main__\":
-    pass
+    runner.main(["{day}"])
 """
 
-with open(f"day{max_day+1}.py", "w") as f:
+with open(f"day{day:02d}.py", "w") as f:
     f.write(file_template)